@@ -43,25 +43,68 @@ class ParameterGroup(str, enum.Enum):
 
     def rootname(self) -> str:
         """Return the group name without trailing '_parameters'"""
-        return self.value.rstrip("_parameters")
+        return _PARAMETER_GROUP_ROOTNAMES[self]
+
+
+# group names without trailing '_parameters' (e.g. 'build' for 'build_parameters')
+_PARAMETER_GROUP_ROOTNAMES = {group: group.value.removesuffix("_parameters") for group in ParameterGroup}
+
+# valid keys to index the parameter groups of SysDef and SysCfg objects (enum members and their string values)
+_PARAMETER_GROUP_KEYS = frozenset(ParameterGroup) | frozenset(group.value for group in ParameterGroup)
 
 
 class SysDefParameterEnum(pydantic.BaseModel):
     """Definition of a enum constraint of a parameter of the SysDef file."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     values: Union[list[str], list[bool], list[int], list[float]]
 
 
 class SysDefParameterRange(pydantic.BaseModel):
     """Definition of a min-max constraint of a parameter of the SysDef file."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     lower: Union[int, float]
     upper: Union[int, float]
 
 
 class SysDefParameterFile(pydantic.BaseModel):
     """Definition of a file parameter in the SysDef file."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     is_file: bool = True
 
 
+def _check_enum_default_value(default_value, meta: SysDefParameterEnum):
+    """Check if the default value is legal for an enum-parameter."""
+    if not isinstance(default_value, type(meta.values[0])):
+        raise ValueError(f"Default value of enum-parameter has unexpected type {type(default_value)}")
+    if default_value not in meta.values:
+        raise ValueError(f"Unexpected default value of enum-parameter '{default_value}'")
+
+
+def _check_range_default_value(default_value, meta: SysDefParameterRange):
+    """Check if the default value is legal for a range-parameter."""
+    if not isinstance(default_value, (int, float)):
+        raise ValueError(f"Default value of range-parameter has unexpected type {type(default_value)}")
+    if not meta.lower <= default_value <= meta.upper:
+        raise ValueError(f"Default value of range-parameter is not inside boundaries: {default_value}")
+
+
+def _check_file_default_value(default_value, _meta: SysDefParameterFile):
+    """Check if the default value is legal for a file-parameter."""
+    if not isinstance(default_value, str):
+        raise ValueError(f"Default value of file-parameter is not a string: '{default_value}'")
+
+
+# default value checks of complex parameters selected by the type of the 'meta' entry
+_META_VALIDATORS = {
+    SysDefParameterEnum: _check_enum_default_value,
+    SysDefParameterRange: _check_range_default_value,
+    SysDefParameterFile: _check_file_default_value,
+}
+
+
 class SysDefCmplxParameter(pydantic.BaseModel):
     """Definition of a parameter of the SysDef file."""
     default_value: Union[str, bool, int, float]
@@ -75,22 +118,16 @@ class SysDefCmplxParameter(pydantic.BaseModel):
     @pydantic.model_validator(mode='after')
     def check_default_value(self):
         """Check if the default value is legal for the used type, which is specified in 'meta'."""
-        if isinstance(self.meta, SysDefParameterEnum):
-            if not isinstance(self.default_value, type(self.meta.values[0])):
-                raise ValueError(f"Default value of enum-parameter has unexpected type {type(self.default_value)}")
-            if self.default_value not in self.meta.values:
-                raise ValueError(f"Unexpected default value of enum-parameter '{self.default_value}'")
-        elif isinstance(self.meta, SysDefParameterRange):
-            if not isinstance(self.default_value, (int, float)):
-                raise ValueError(f"Default value of range-parameter has unexpected type {type(self.default_value)}")
-            if not self.meta.lower <= self.default_value <= self.meta.upper:
-                raise ValueError(f"Default value of range-parameter is not inside boundaries: {self.default_value}")
-        elif isinstance(self.meta, SysDefParameterFile):
-            if not isinstance(self.default_value, str):
-                raise ValueError(f"Default value of file-parameter is not a string: '{self.default_value}'")
+        check = _META_VALIDATORS.get(type(self.meta))
+        if check is not None:
+            check(self.default_value, self.meta)
         return self
 
 
+# value type of a parameter inside a parameter group of the SysDef file
+SysDefParameterValue = Union[str, bool, int, float, SysDefCmplxParameter, None]
+
+
 class SysDefResult(pydantic.BaseModel):
     """Definition of a complex result of the SysDef file."""
     type: resultformats.ResultTypes
@@ -116,82 +153,104 @@ class SysDef(pydantic.BaseModel):
     build_command: Optional[str] = None
     run_command: str
     delete_command: Optional[str] = None
-    common_parameters: Optional[
-        dict[str, Union[str, bool, int, float, SysDefCmplxParameter, None]]] = None
-    build_parameters: Optional[
-        dict[str, Union[str, bool, int, float, SysDefCmplxParameter, None]]] = None
-    run_parameters: Optional[
-        dict[str, Union[str, bool, int, float, SysDefCmplxParameter, None]]] = None
+    common_parameters: Optional[dict[str, SysDefParameterValue]] = None
+    build_parameters: Optional[dict[str, SysDefParameterValue]] = None
+    run_parameters: Optional[dict[str, SysDefParameterValue]] = None
     results: Optional[dict[str, SysDefResult]] = None
 
     @pydantic.model_validator(mode='after')
     def check_result_enabled_by(self):
         """Check of the 'enabled_by' switch of the result objects during model validation."""
+        if self.results is None:
+            return self
+        # flat mapping of all parameters addressed by a JSON pointer without the leading '#/'
+        # (e.g. 'build_parameters/my_param')
+        parameter_values = {}
+        for parameter_group in ParameterGroup:
+            if self[parameter_group] is not None:
+                for parameter_name, parameter_value in self[parameter_group].items():
+                    parameter_values[f"{parameter_group.value}/{parameter_name}"] = parameter_value
         for result in self.results.values():
             if result.enabled_by is not None:
                 for enabler in result.enabled_by:
                     if not enabler.startswith("#/"):
                         raise ValueError(f"'enabled_by' must start with '#/' to be a valid JSON pointer: '{enabler}'")
-
-                    enabler_hierarchy = enabler.split('/')
-                    parameter_group = ParameterGroup(enabler_hierarchy[1])
-                    parameter_name = enabler_hierarchy[2]
-                    if parameter_name not in self[parameter_group]:
+                    if enabler[2:] not in parameter_values:
                         raise ValueError(f"Enabling parameter name does not exist: '{enabler}'")
-                    if not isinstance(self[parameter_group][parameter_name], bool):
+                    if not isinstance(parameter_values[enabler[2:]], bool):
                         raise ValueError(f"Enabling parameter must be of type bool: '{enabler}'")
         return self
 
     def __getitem__(self, item):
         """Make class indexable e.g. to read parameter groups with name: my_sysdef["build_parameters"]"""
+        if item not in _PARAMETER_GROUP_KEYS:
+            raise KeyError(item)
         return getattr(self, item)
 
     def __setitem__(self, item, value):
         """Make class indexable e.g. to writer parameter groups with name: my_sysdef["build_parameters"] = {...}"""
+        if item not in _PARAMETER_GROUP_KEYS:
+            raise KeyError(item)
         return setattr(self, item, value)
 
 
 class SysCfgSystem(pydantic.BaseModel):
     """Definition of the system description part of the SysCfg file."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     name: str
     version: str
 
 
 class SysCfgUrlParameter(pydantic.BaseModel):
     """Definition of a URL-based file parameter entry in the SysCfg file."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     url: str
     credentials: Optional[str] = None
 
 
+# value type of a parameter inside a parameter group of the SysCfg file
+SysCfgParameterValue = Union[str, bool, int, float, SysCfgUrlParameter, None]
+
+
 class SysCfg(pydantic.BaseModel):
     """Definition of the system configuration file format (SysCfg)."""
     dataformat: Optional[str] = SYSCFG_DATAFORMAT_IDENTIFIER
     system: SysCfgSystem
-    common_parameters: Optional[dict[str, Union[str, bool, int, float, SysCfgUrlParameter, None]]] = None
-    build_parameters: Optional[dict[str, Union[str, bool, int, float, SysCfgUrlParameter, None]]] = None
-    run_parameters: Optional[dict[str, Union[str, bool, int, float, SysCfgUrlParameter, None]]] = None
+    common_parameters: Optional[dict[str, SysCfgParameterValue]] = None
+    build_parameters: Optional[dict[str, SysCfgParameterValue]] = None
+    run_parameters: Optional[dict[str, SysCfgParameterValue]] = None
 
     def __getitem__(self, item):
         """Make class indexable e.g. to read parameter groups with name: my_syscfg["build_parameters"]"""
+        if item not in _PARAMETER_GROUP_KEYS:
+            raise KeyError(item)
         return getattr(self, item)
 
     def __setitem__(self, item, value):
         """Make class indexable e.g. to writer parameter groups with name: my_syscfg["build_parameters"] = {...}"""
+        if item not in _PARAMETER_GROUP_KEYS:
+            raise KeyError(item)
         return setattr(self, item, value)
 
     @classmethod
     def from_sysdef(cls, sysdef: SysDef):
-        """Create a new SysCfg instance with default values from a SysDef object."""
-        instance = cls(system=SysCfgSystem(name=sysdef.name, version=sysdef.version))
+        """Create a new SysCfg instance with default values from a SysDef object.
+
+        The content of the SysDef object is already validated, so the instance is constructed without validation.
+        """
+        parameter_groups = {}
         for param_grp in ParameterGroup:
             if sysdef[param_grp]:
-                instance[param_grp] = {}
-                for key in sysdef[param_grp]:
-                    if isinstance(sysdef[param_grp][key], SysDefCmplxParameter):
-                        instance[param_grp][key] = sysdef[param_grp][key].default_value
+                parameter_groups[param_grp.value] = {}
+                for key, value in sysdef[param_grp].items():
+                    if isinstance(value, SysDefCmplxParameter):
+                        parameter_groups[param_grp.value][key] = value.default_value
                     else:
-                        instance[param_grp][key] = sysdef[param_grp][key]
-        return instance
+                        parameter_groups[param_grp.value][key] = value
+        return cls.model_construct(system=SysCfgSystem.model_construct(name=sysdef.name, version=sysdef.version),
+                                   **parameter_groups)
 
 
 class LogEntry(pydantic.BaseModel):
@@ -217,6 +276,8 @@ class SessionInfo(pydantic.BaseModel):
 
 class ResultInfo(pydantic.BaseModel):
     """Holds information about a result."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     name: str
     type: resultformats.ResultTypes
     is_available: bool
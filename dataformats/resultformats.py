@@ -11,8 +11,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import csv
 import enum
+import re
 from typing import Union, Optional
 import pydantic
 
@@ -32,6 +34,8 @@ class ResultTypes(str, enum.Enum):
 
 class Performance(pydantic.BaseModel):
     """Format to describe performance metrics of a CPU."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     instructions: Optional[int] = None  # Number of executed instructions
     cycles: Optional[int] = None  # Number of required clock cycles
     frequency_hz: Optional[float] = None  # Core clock frequency, defines the cycle period
@@ -39,6 +43,8 @@ class Performance(pydantic.BaseModel):
 
 class SimSpeed(pydantic.BaseModel):
     """Format to define execution performance of a simulation."""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     simulated_time_sec: float  # Duration that was simulated in seconds.
     execution_time_sec: float  # The time how long the simulation ran (wall-clock time) in seconds.
 
@@ -47,8 +53,22 @@ class SimSpeed(pydantic.BaseModel):
         return self.execution_time_sec / self.simulated_time_sec
 
 
+# hexadecimal address with optional '0x' prefix (int() would also accept signs and underscores)
+_ADDRESS_REGEX = re.compile(r'(?:0[xX])?[0-9a-fA-F]+')
+
+
+def parse_address(value: str) -> int:
+    """Convert a hexadecimal address string with or without leading '0x' to an integer"""
+    value = value.strip()
+    if _ADDRESS_REGEX.fullmatch(value) is None:
+        raise ValueError("Address must be a hexadecimal number")
+    return int(value, 16)
+
+
 class FunctionProfileData(pydantic.BaseModel):
     """Profiling results for a single function"""
+    model_config = pydantic.ConfigDict(frozen=True)
+
     function: str
     address: int
     count: int
@@ -61,35 +81,92 @@ class FunctionProfileData(pydantic.BaseModel):
     def validate_address(cls, value: Union[int, str]):
         """Address typically is a hexadecimal number read as string - store it as integer"""
         if isinstance(value, str):
-            if value.startswith("0x"):
-                value = value[2:]
-            try:
-                return int(value, 16)
-            except ValueError as exc:
-                raise ValueError("Address must be a hexadecimal number") from exc
-        else:
-            return value
+            return parse_address(value)
+        return value
 
 
 class FunctionProfile:
-    """Overall function profiling result table, typically from parsing a CSV file"""
-    def __init__(self, function_data_list: list[FunctionProfileData]):
-        self.functions = function_data_list
+    """Overall function profiling result table, typically from parsing a CSV file
+
+    The table is stored column-wise, the list of FunctionProfileData objects is only created on request. The
+    columns are the source of truth: changing the returned list has no effect on the table, assign a new list to
+    `functions` instead.
+    """
+    def __init__(self, function_data_list: Optional[list[FunctionProfileData]] = None):
+        self.function: list[str] = []
+        self.address = array.array('Q')
+        self.count = array.array('q')
+        self.percent = array.array('d')
+        self.self_cycles = array.array('q')
+        self.cumulative_cycles = array.array('q')
+        self._functions = None
+        if function_data_list is not None:
+            self.functions = function_data_list
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _append(self, function, address, count, percent, self_cycles, cumulative_cycles):
+        """Append a single function to the columns of the table"""
+        self.function.append(function)
+        self.address.append(address)
+        self.count.append(count)
+        self.percent.append(percent)
+        self.self_cycles.append(self_cycles)
+        self.cumulative_cycles.append(cumulative_cycles)
+
+    @property
+    def functions(self) -> list[FunctionProfileData]:
+        """List of FunctionProfileData objects, created from the columns on first access"""
+        if self._functions is None:
+            self._functions = [
+                FunctionProfileData.model_construct(function=function, address=address, count=count, percent=percent,
+                                                    self_cycles=self_cycles, cumulative_cycles=cumulative_cycles)
+                for function, address, count, percent, self_cycles, cumulative_cycles in zip(
+                    self.function, self.address, self.count, self.percent, self.self_cycles,
+                    self.cumulative_cycles)]
+        return self._functions
+
+    @functions.setter
+    def functions(self, function_data_list: list[FunctionProfileData]):
+        """Replace all functions of the table by the functions of the list"""
+        for column in (self.function, self.address, self.count, self.percent, self.self_cycles,
+                       self.cumulative_cycles):
+            del column[:]
+        for fn in function_data_list:
+            self._append(fn.function, fn.address, fn.count, fn.percent, fn.self_cycles, fn.cumulative_cycles)
+        self._functions = None
 
     @classmethod
     def from_csv_file(cls, filepath):
-        """Read the a CSV file and convert the data to a list of FunctionProfileData dictionaries"""
-        with open(filepath, 'r', encoding="utf-8") as csv_file:
-            reader = csv.DictReader(csv_file)
-            functions = []
+        """Read the a CSV file and convert the data to the columns of a function profile table
+
+        The columns are converted explicitly, so the rows are stored without a pydantic validation.
+        """
+        instance = cls()
+        with open(filepath, 'r', encoding="utf-8", newline='') as csv_file:
+            reader = csv.reader(csv_file)
+            # resolve the column indices once from the header row
+            header = next(reader, None)
+            if header is None:
+                return instance
+            i_function, i_address, i_count, i_percent, i_self_cycles, i_cumulative_cycles = (
+                header.index(name) for name in ('function', 'address', 'count', 'percent', 'self_cycles',
+                                                'cumulative_cycles'))
             for row in reader:
-                functions.append(FunctionProfileData.model_validate(row))
-        return cls(functions)
+                # csv.DictReader skips empty lines (e.g. a trailing blank line), csv.reader returns them as empty row
+                if not row:
+                    continue
+                instance._append(row[i_function],
+                                 parse_address(row[i_address]),
+                                 int(row[i_count]),
+                                 float(row[i_percent]),
+                                 int(row[i_self_cycles]),
+                                 int(row[i_cumulative_cycles]))
+        return instance
 
     def len(self):
         """Return number of functions tracked"""
-        return len(self.functions)
+        return len(self.function)
 
     def cycles(self):
         """calculate how many cycles are recorded in the profile"""
-        return sum(fn.self_cycles for fn in self.functions)
+        return sum(self.self_cycles)
@@ -16,22 +16,64 @@ Compute backend interface for build/run operations of systems.
 """
 
 import os
+import io
 import logging
 import enum
 import tarfile
-import pathlib
 import docker
 import compute_if
 
 
+# names of the proxy environment variables copied from host to container
+PROXY_ENV_NAMES = ('http_proxy', 'https_proxy', 'HTTP_PROXY', 'HTTPS_PROXY', 'no_proxy', 'NO_PROXY')
+
+# errors raised by the Docker client during container and volume operations
+# (NotFound and ImageNotFound are sub-classes of APIError)
+DOCKER_ERRORS = (docker.errors.ContainerError, docker.errors.ImageNotFound, docker.errors.APIError)
+
+# errors raised during the execution of a container
+EXECUTION_ERRORS = (OSError, ValueError, NameError, RuntimeError) + DOCKER_ERRORS
+
+# images already pulled from the registry (session id and image), kept in the process as the compute backend of a
+# session is restored from the session file for each build or run
+_pulled_images: set[tuple[str, str]] = set()
+
+
 def change_file_permission(tarinfo):
     """Changes the file permission to full access for the provided tarinfo object.
 
     This helper function will be called by the __copy_files() function during the tar archive creation."""
-    tarinfo.mode = int('0777', base=8)
+    tarinfo.mode = 0o777
     return tarinfo
 
 
+class ArchiveStreamReader(io.RawIOBase):
+    """Read-only file object on top of an iterator of byte chunks, e.g. an archive stream of the Docker daemon.
+
+    It allows to extract a tar stream with the tarfile package without storing it in a temporary file."""
+
+    def __init__(self, chunks) -> None:
+        self._chunks = iter(chunks)
+        self._chunk = b''
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        # get next chunk from iterator if the current chunk is fully consumed
+        while self._offset >= len(self._chunk):
+            try:
+                self._chunk = next(self._chunks)
+            except StopIteration:
+                return 0
+            self._offset = 0
+        size = min(len(buffer), len(self._chunk) - self._offset)
+        buffer[:size] = self._chunk[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
 class CopyDirection(enum.Enum):
     """Definition of the copy direction between SUNRISE Runtime Manager and container workspace."""
     SUNRISE_TO_CONTAINER = 1
@@ -50,6 +92,11 @@ class ComputeDocker(compute_if.ComputeInterface):
         self._volume = None
         self._volume_name: str = None
 
+    @property
+    def _copy_container_name(self) -> str:
+        """Name of the helper container used to copy files from and to the session volume."""
+        return 'sunrise_session_copy_container_' + self._system.session_id
+
     def create_resource(self, system: compute_if.ComputeSystem, progress: compute_if.ComputeProgress = None):
         # get sunrise container logger
         self._system = system
@@ -75,13 +122,13 @@ class ComputeDocker(compute_if.ComputeInterface):
         container_name = f"sunrise_session_container_{self._system.session_id}"
         try:
             container = self._client.containers.get(container_name)
-        except (docker.errors.ContainerError, docker.errors.APIError) as exc:
+        except DOCKER_ERRORS as exc:
             message = f"Unable to find container '{container_name}' to stop it: {str(exc)}"
             self._log.error(message)
             raise compute_if.ComputeResourceUnavailableError(message) from exc
         try:
             container.stop()
-        except (docker.errors.ContainerError, docker.errors.APIError) as exc:
+        except DOCKER_ERRORS as exc:
             message = f"Unable to stop container '{container_name}': {str(exc)}"
             self._log.error(message)
             raise compute_if.ComputeResourceError(message) from exc
@@ -93,10 +140,7 @@ class ComputeDocker(compute_if.ComputeInterface):
         source_file = os.path.join(self._system.work_dir, path)
         file_name = os.path.basename(source_file)
         results_dir = os.path.join(self._system.local_dir, 'results')
-        if not os.path.exists(results_dir):
-            self._log.debug("Creating results directory '%s'...", results_dir)
-            work_dir_obj = pathlib.Path(results_dir)
-            work_dir_obj.mkdir(parents=True)
+        os.makedirs(results_dir, exist_ok=True)
         destination_file = os.path.join(results_dir, file_name)
         files: list[compute_if.ComputeFile] = [compute_if.ComputeFile(source_path=source_file,
                                                                       destination_path=destination_file)]
@@ -113,12 +157,18 @@ class ComputeDocker(compute_if.ComputeInterface):
             for container in containers:
                 container.kill()
                 container.remove()
+            # the copy helper container is never started -> remove it separately
+            try:
+                self._client.containers.get(self._copy_container_name).remove(force=True)
+            except docker.errors.NotFound:
+                pass
             # allow a cleanup of the container itself if delete command is defined (max. of 10 seconds allowed)
             if self._system.delete_command is not None and len(self._system.delete_command) > 0:
                 self.__execute_container(self._system.delete_command, timeout=10.0)
             self._volume.remove()
+            _pulled_images.discard((self._system.session_id, self._system.image))
             self._log.debug("Successfully removed Docker volume of session.")
-        except (docker.errors.APIError, docker.errors.NotFound, docker.errors.ContainerError) as exc:
+        except DOCKER_ERRORS as exc:
             message = f"Docker volume cannot be removed: {str(exc)}"
             self._log.error(message)
             raise compute_if.ComputeResourceUnavailableError(message) from exc
@@ -131,14 +181,19 @@ class ComputeDocker(compute_if.ComputeInterface):
         del state['_log']
         del state['_client']
         del state['_volume']
+        # the output of the last container execution is already part of the session log
+        del state['_output']
         return state
 
     def __setstate__(self, state):
         """Defines which data of this class can be deserialized by pickle."""
         # restore instance attributes
         self.__dict__.update(state)
+        # session files of older versions contain the copy container name
+        self.__dict__.pop('_copy_container_name', None)
         # restore unpicklable entries
         self._log = logging.getLogger('sunrise.container')
+        self._output = None
         self._client = docker.from_env()
         try:
             self._volume = self._client.volumes.get(self._volume_name)
@@ -149,27 +204,37 @@ class ComputeDocker(compute_if.ComputeInterface):
 
     def __pull_image(self):
         """Pulls docker image from registry."""
-        if "/" in self._system.image:
+        if (self._system.session_id, self._system.image) in _pulled_images:
+            self._log.debug('Docker image already pulled for this session')
+        elif "/" in self._system.image:
             self._log.debug('Pulling docker image')
             self._client.images.pull(self._system.image)
+            _pulled_images.add((self._system.session_id, self._system.image))
         else:
             # using local available Docker image as image name does not contain a full URL
             self._log.debug('Using local docker image without container registry')
 
     def __set_environment(self) -> dict:
         """Copies proxy settings of host to container if available."""
-        environment = {}
-        proxy_env_names = ['http_proxy', 'https_proxy', 'HTTP_PROXY', 'HTTPS_PROXY', 'no_proxy', 'NO_PROXY']
-        for proxy_env_name in proxy_env_names:
-            try:
-                env_value = os.environ[proxy_env_name]
-                environment[proxy_env_name] = env_value
-                self._log.debug("Setting environment variable %s=%s inside Docker container.", proxy_env_name,
-                                env_value)
-            except KeyError:
-                pass
+        environment = {name: os.environ[name] for name in PROXY_ENV_NAMES if name in os.environ}
+        for env_name, env_value in environment.items():
+            self._log.debug("Setting environment variable %s=%s inside Docker container.", env_name, env_value)
         return environment
 
+    def __get_copy_container(self, volumes: dict):
+        """Returns the helper container for copy operations between SUNRISE Runtime Manager and the session volume.
+
+        The container is created only once per session and is never started, as archive operations do not
+        require a running container.
+        """
+        try:
+            return self._client.containers.get(self._copy_container_name)
+        except docker.errors.NotFound:
+            self.__pull_image()
+            # the command is never executed but avoids that creation fails for images without a default command
+            return self._client.containers.create(image=self._system.image, name=self._copy_container_name,
+                                                  command=["true"], volumes=volumes)
+
     def __copy_files(self, files: list[compute_if.ComputeFile], direction: CopyDirection):
         """Copy operation between SUNRISE Runtime Manager workspace and container workspace.
         Uses a native docker copy operation with a tar filestream.
@@ -178,56 +243,49 @@ class ComputeDocker(compute_if.ComputeInterface):
         volumes = {self._volume.name: {'bind': str(self._system.mount_dir), 'mode': 'rw'}}
 
         try:
-            self.__pull_image()
-            container = self._client.containers.run(image=self._system.image, volumes=volumes, detach=True)
-            container.wait()
+            container = self.__get_copy_container(volumes)
 
             if direction is CopyDirection.SUNRISE_TO_CONTAINER:
-                # directory or file to be copied
-                tar_filepath_local = os.path.join(self._system.local_dir, 'tmp_file_transfer.tar')
                 # internal directory structure of tar file
                 # running sessions expect input/repo to be placed accordingly
-                # generate tar file
-                with tarfile.open(tar_filepath_local, "w") as tar_file:
-                    # tracks all added directories to avoid multiple adding of same directory
-                    added_directories = set()
+                # generate tar archive in memory to avoid a temporary file in the workspace
+                # (archive is written as sequential stream as it is consumed sequentially by the upload)
+                tar_buffer = io.BytesIO()
+                with tarfile.open(fileobj=tar_buffer, mode="w|", bufsize=64 * 1024) as tar_file:
+                    # collect parent directories of all files once (key = archive path, value = local path)
+                    parent_directories = {}
                     for file in files:
-                        # check if current file is a file
                         if os.path.isfile(file.source_path):
-                            # add parent directory to the archive to avoid that
-                            # this parent folder will get a root owner inside the container
-                            if os.path.dirname(file.destination_path) not in added_directories:
-                                tar_file.add(os.path.dirname(file.source_path),
-                                             arcname=os.path.dirname(file.destination_path),
-                                             recursive=False,
-                                             filter=change_file_permission)
-                                added_directories.add(os.path.dirname(file.destination_path))
+                            parent_directories.setdefault(os.path.dirname(file.destination_path),
+                                                          os.path.dirname(file.source_path))
+                    # add parent directories to the archive to avoid that
+                    # these parent folders will get a root owner inside the container
+                    for destination_dir, source_dir in parent_directories.items():
+                        tar_file.add(source_dir,
+                                     arcname=destination_dir,
+                                     recursive=False,
+                                     filter=change_file_permission)
+                    for file in files:
                         tar_file.add(file.source_path,
                                      arcname=file.destination_path,
                                      recursive=False,
                                      filter=change_file_permission)
-                # open tar file and push it to running container
-                with open(tar_filepath_local, "rb") as tar_file:
-                    container.put_archive("/", tar_file)
-                os.remove(tar_filepath_local)
+                # push tar archive to container
+                tar_buffer.seek(0)
+                container.put_archive("/", tar_buffer)
 
             elif direction is CopyDirection.CONTAINER_TO_SUNRISE:
-                # container source and sunrise destination file and folder handling
-                destination_file = os.path.join(self._system.local_dir, 'results', 'tmp_file_transfer.tar')
-                # read the container source to a byte stream
-                bits, stat = container.get_archive(files[0].source_path)
-                self._log.debug("Container copy operation 'stat' information: %s", stat)
-                # move byte stream to a tar file
-                with open(destination_file, 'wb+') as tar_file:
-                    for chunk in bits:
-                        tar_file.write(chunk)
-                # extract tarfile to destination folder
-                with tarfile.open(destination_file, 'r:') as tar_file:
-                    tar_file.extractall(os.path.dirname(destination_file))
-                os.remove(destination_file)
-            container.remove()
-
-        except (docker.errors.ContainerError, docker.errors.ImageNotFound, docker.errors.APIError) as exc:
+                # sunrise destination folder handling
+                destination_dir = os.path.join(self._system.local_dir, 'results')
+                for file in files:
+                    # read the container source to a byte stream
+                    bits, stat = container.get_archive(file.source_path)
+                    self._log.debug("Container copy operation 'stat' information: %s", stat)
+                    # extract byte stream directly to destination folder without a temporary tar file
+                    with tarfile.open(fileobj=io.BufferedReader(ArchiveStreamReader(bits)), mode='r|') as tar_file:
+                        tar_file.extractall(destination_dir)
+
+        except DOCKER_ERRORS as exc:
             message = f"Exception occurred during Docker copy operation: {str(exc.explanation)}"
             self._log.error(message)
             raise RuntimeError(message) from exc
@@ -257,18 +315,27 @@ class ComputeDocker(compute_if.ComputeInterface):
                 working_dir=str(self._system.work_dir))
 
             if progress:
-                logs = container.logs(stream=True)
-                for log in logs:
-                    progress(0, log.decode("utf-8"))
-            # wait until container execution is completed
-            container_status = container.wait()
-
-            self._output = container.logs().decode("utf-8")
+                # forward streamed log chunks and collect them to avoid fetching the full log a second time
+                # (chunks are forwarded in batches as the callback might be expensive, e.g. storing the session)
+                throttled_progress = compute_if.ThrottledProgress(progress)
+                output = bytearray()
+                try:
+                    for log in container.logs(stream=True):
+                        output += log
+                        throttled_progress(0, log.decode("utf-8", errors="replace"))
+                finally:
+                    throttled_progress.flush()
+                # wait until container execution is completed
+                container_status = container.wait()
+                self._output = output.decode("utf-8")
+            else:
+                # wait until container execution is completed
+                container_status = container.wait()
+                self._output = container.logs().decode("utf-8")
 
             container.remove()
 
-        except (OSError, ValueError, NameError, FileNotFoundError, RuntimeError,
-                docker.errors.ContainerError, docker.errors.ImageNotFound, docker.errors.APIError) as exc:
+        except EXECUTION_ERRORS as exc:
             # mark session as failed in case any exception occurred during build
             self._log.error(str(exc))
             self._output = str(exc)
@@ -17,7 +17,9 @@ Compute backend interface for build/run operations of systems.
 
 import os
 import abc
+import time
 import typing
+import threading
 import dataclasses
 
 
@@ -98,6 +100,59 @@ class ComputeSystem:
 ComputeProgress = typing.Callable[[int, str], None]
 
 
+class ThrottledProgress:
+    """Wraps a progress callback and forwards updates at most once per interval.
+
+    Messages of suppressed updates are collected and forwarded together with the next update, so no message is
+    lost. An update is forwarded immediately if the progress increased by at least one percent or reached 100,
+    otherwise the collected messages are forwarded by a timer at the end of the interval. Call 'flush()' after the
+    last update to forward remaining messages and to stop the timer.
+    """
+
+    def __init__(self, callback: ComputeProgress, min_interval_s: float = 0.1) -> None:
+        self._callback = callback
+        self._min_interval_s = min_interval_s
+        self._last_progress = 0
+        self._last_time = time.monotonic()
+        self._pending_progress = None
+        self._pending_messages: list[str] = []
+        # updates are forwarded by the calling thread or by the timer thread
+        self._lock = threading.Lock()
+        self._timer: threading.Timer = None
+
+    def __call__(self, progress: int, message: str) -> None:
+        with self._lock:
+            self._pending_progress = progress
+            self._pending_messages.append(message)
+            wait_time = self._min_interval_s - (time.monotonic() - self._last_time)
+            if progress >= 100 or progress - self._last_progress >= 1 or wait_time <= 0:
+                self.__forward()
+            elif self._timer is None:
+                # forward the suppressed update at the end of the interval, even if no further update follows
+                self._timer = threading.Timer(wait_time, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Forwards all collected messages to the wrapped callback."""
+        with self._lock:
+            self.__forward()
+
+    def __forward(self) -> None:
+        """Forwards all collected messages, must be called with acquired lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending_progress is None:
+            return
+        progress, message = self._pending_progress, "".join(self._pending_messages)
+        self._pending_progress = None
+        self._pending_messages.clear()
+        self._last_progress = progress
+        self._last_time = time.monotonic()
+        self._callback(progress, message)
+
+
 #######################
 # INTERFACE DEFINITIONS
 #######################
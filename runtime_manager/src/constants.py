@@ -28,15 +28,19 @@ SESSIONS_BASE_DIR = os.environ.get('SUNRISE_RUNTIME_MANAGER_SESSION_PATH', os.pa
 # working dir inside Docker container (mount point of Docker volume), use absolute path
 CONTAINER_WORKDIR = '/sysapi'
 
+# directory of the input files inside Docker container
+CONTAINER_INPUTS_DIR = os.path.join(CONTAINER_WORKDIR, 'inputs')
+
 # default name of a session creator
 DEFAULT_CREATOR_NAME = 'default-user'
 
 # absolute filepath to the SUNRISE Runtime Manager root directory
 SUNRISE_RUNTIME_MANAGER_FULL_PATH = pathlib.Path(__file__).parent.parent.resolve()
 
-# version of SUNRISE Runtime Manager as string (major.minor version number)
-with open(os.path.join(SUNRISE_RUNTIME_MANAGER_FULL_PATH, 'VERSION'), mode="r", encoding="utf-8") as version_file:
-    SUNRISE_RUNTIME_MANAGER_VERSION = version_file.readline().strip()
-
 # absolute filepath to the system references (SysRefs) in case local database is used
 SYSTEM_REFERENCES_FILE = os.path.join(SUNRISE_RUNTIME_MANAGER_FULL_PATH, 'config', 'systems', 'systems.json')
+
+# version of SUNRISE Runtime Manager as string (major.minor version number)
+# (only the first line is decoded, the file is read as bytes to avoid the setup of a text stream)
+SUNRISE_RUNTIME_MANAGER_VERSION = (
+    (SUNRISE_RUNTIME_MANAGER_FULL_PATH / 'VERSION').read_bytes().split(b'\n', 1)[0].decode('utf-8').strip())
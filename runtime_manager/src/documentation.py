@@ -16,8 +16,8 @@ Handles parsing of system documentation.
 """
 
 import os
-import pathlib
-import base64
+import io
+import binascii
 import re
 
 
@@ -25,7 +25,13 @@ class MarkdownImageEmbedder:
     """Embeds images as base64-encoded string into a markdown file."""
 
     # regular expression to match markdown images
-    _markdown_image_regex = r"!\[(.*?)\]\(\s*(?!https?://)(.*?)\s*\)"
+    _markdown_image_regex = re.compile(r"!\[(.*?)\]\(\s*(?!https?://)(.*?)\s*\)")
+
+    # size of the chunks read from an image file for base64 encoding (multiple of 3 bytes)
+    _encode_chunk_size = 3 * io.DEFAULT_BUFFER_SIZE
+
+    # supported image file endings and their image format identifier of the embedded data
+    _image_formats = {'png': 'png', 'jpg': 'jpg', 'jpeg': 'jpg'}
 
     def __init__(self, input_markdown: str, markdown_dir: os.PathLike) -> None:
         self.input_markdown = input_markdown
@@ -33,29 +39,34 @@ class MarkdownImageEmbedder:
 
     def extract_images_paths_from_markdown(self) -> list[os.PathLike]:
         """Extract all images paths from a markdown and return them as a list."""
-        matches = re.findall(MarkdownImageEmbedder._markdown_image_regex, self.input_markdown)
-        images_paths = []
-        for match in matches:
-            images_paths.append(match[1])
-        return images_paths
+        return [match.group(2) for match in MarkdownImageEmbedder._markdown_image_regex.finditer(self.input_markdown)]
 
     def _encode_image(self, image_path: os.PathLike):
         """Opens the image and returns the image content as base64-encoded string."""
-        if not os.path.isfile(image_path):
-            raise FileNotFoundError(f"Referenced image path '{image_path}' in markdown file cannot be found!")
-        with open(image_path, "rb") as image_file:
-            # encode image to base64 string
-            image_b64_bytes = base64.b64encode(image_file.read())
-            image_b64_string = image_b64_bytes.decode('utf-8')
+        try:
+            image_file = open(image_path, "rb")  # pylint: disable=consider-using-with
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"Referenced image path '{image_path}' in markdown file cannot be found!") from exc
+        with image_file:
+            # allocate the base64 output once, its size is known from the image file size
+            image_size = os.fstat(image_file.fileno()).st_size
+            image_b64_bytes = bytearray(4 * ((image_size + 2) // 3))
+            position = 0
+            # encode image to base64 string chunk-wise (chunk size must be a multiple of 3 bytes to
+            # avoid padding characters inside the encoded data)
+            while chunk := image_file.read(MarkdownImageEmbedder._encode_chunk_size):
+                encoded_chunk = binascii.b2a_base64(chunk, newline=False)
+                image_b64_bytes[position:position + len(encoded_chunk)] = encoded_chunk
+                position += len(encoded_chunk)
+            # drop unused space in case the file was changed while reading
+            del image_b64_bytes[position:]
+        image_b64_string = image_b64_bytes.decode('ascii')
         # remove '.' from file ending and make file ending lower case to get pure image format identifier
-        image_format = str.replace(str.lower(pathlib.Path(image_path).suffix), '.', '')
-        if image_format == 'jpeg':
-            image_format = 'jpg'
-        if image_format in ('png', 'jpg'):
-            string = f"![](data:image/{image_format};base64,{image_b64_string})"
-        else:
+        image_format = os.path.splitext(image_path)[1].lower().lstrip('.')
+        data_format = MarkdownImageEmbedder._image_formats.get(image_format)
+        if data_format is None:
             raise ValueError(f"Unexpected image file format '{image_format}' for markdown content!")
-        return string
+        return f"![](data:image/{data_format};base64,{image_b64_string})"
 
     def embed_images_in_markdown(self, base_dir: str) -> str:
         """Embeds for each image link in the markdown file the base64-encoded string for the image content.
@@ -63,15 +74,16 @@ class MarkdownImageEmbedder:
         The base_dir is added in front of the image paths inside the input markdown to extract the image
         content at a valid path in the file system.
         """
-        output_markdown = ''
-        current_position = 0
-        # iterate over all images in input markdown and replace by base64-encoded image content
-        for match in re.finditer(MarkdownImageEmbedder._markdown_image_regex, self.input_markdown):
-            end, newstart = match.span()
-            output_markdown += self.input_markdown[current_position:end]
+        # encoded images by resolved file path to encode images referenced multiple times only once
+        encoded_images: dict[str, str] = {}
+
+        def replace_image(match: re.Match) -> str:
+            """Returns the base64-encoded image content for a matched image link."""
             image_filename = os.path.join(base_dir, self.markdown_dir, match.group(2))
-            replacement_string = self._encode_image(image_filename)
-            output_markdown += replacement_string
-            current_position = newstart
-        output_markdown += self.input_markdown[current_position:]
-        return output_markdown
+            image_key = os.path.realpath(image_filename)
+            if image_key not in encoded_images:
+                encoded_images[image_key] = self._encode_image(image_filename)
+            return encoded_images[image_key]
+
+        # replace all images in input markdown by base64-encoded image content
+        return MarkdownImageEmbedder._markdown_image_regex.sub(replace_image, self.input_markdown)
@@ -20,8 +20,8 @@ import logging
 import shutil
 import enum
 import dataclasses
-import pathlib
 import urllib.request
+import concurrent.futures
 import constants
 from dataformats import dataformats
 
@@ -34,6 +34,22 @@ class FileState(enum.Enum):
     AVAILABLE = 4  # system container has access to the file
 
 
+def link_or_copy_file(source: os.PathLike, destination: os.PathLike):
+    """Makes a file available at the destination path by a hard link or by a copy as fallback.
+
+    A hard link avoids copying the file content if source and destination are on the same file system.
+    The staged file must therefore only be read and never be modified in place.
+    """
+    # remove an existing destination first, as it might be a hard link to another file which must not be overwritten
+    if os.path.lexists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        # different file system or missing permission to create hard links
+        shutil.copyfile(source, destination)
+
+
 @dataclasses.dataclass
 class FileData:
     """Holds file-specific information of a file parameter."""
@@ -49,9 +65,13 @@ class FileData:
 class Parameter:
     """Handles a parameter of a system."""
 
+    # string values which are interpreted as 'true' for boolean parameters (compared in lower case)
+    _true_strings = frozenset({'true', '1', 'yes', 'on'})
+
+    # sunrise session logger (shared by all parameters)
+    _log = logging.getLogger('sunrise.system')
+
     def __init__(self, name, value, sysdef_param_value, overwritten) -> None:
-        # get sunrise session logger
-        self._log = logging.getLogger('sunrise.system')
         self.name: str = name
         self.value = value
         self.overwritten: bool = overwritten
@@ -64,16 +84,20 @@ class Parameter:
             self.default_value = sysdef_param_value.default_value
             # set value in case parameter is not overwritten
             if not overwritten:
-                self.value = sysdef_param_value.default_value
+                self.value = self.default_value
             # get meta data of current parameter
-            if sysdef_param_value.meta:
-                self.meta_data = sysdef_param_value.meta
-                if isinstance(self.meta_data, dataformats.SysDefParameterFile):
-                    # current parameter is a file parameter -> specific parsing required
-                    self.__parse_file_parameter(self.meta_data.is_file, self.default_value)
+            meta_data = sysdef_param_value.meta
+            if meta_data:
+                self.meta_data = meta_data
+                # some meta data types require a specific parsing (e.g. file parameters)
+                meta_parser = Parameter._meta_parsers.get(type(meta_data))
+                if meta_parser is not None:
+                    meta_parser(self, meta_data)
 
-    def __parse_file_parameter(self, param_subentry_value, sysdef_param_path_value):
+    def __parse_file_parameter(self, meta_data: dataformats.SysDefParameterFile):
         """Parses a file parameter from the system definition file and system configuration file."""
+        param_subentry_value = meta_data.is_file
+        sysdef_param_path_value = self.default_value
         if isinstance(param_subentry_value, bool):
             if param_subentry_value:
                 # current parameter is a file -> create file data object
@@ -113,10 +137,18 @@ class Parameter:
             self._log.error(message)
             raise ValueError(message)
 
+    def __create_input_dirs(self, session_id, group) -> tuple[str, str]:
+        """Creates the local input directory of the parameter and returns it together with the input directory
+        inside the Docker container."""
+        destination_path = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id), 'inputs', group, self.name)
+        os.makedirs(destination_path, exist_ok=True)
+        return destination_path, os.path.join(constants.CONTAINER_INPUTS_DIR, group, self.name)
+
     def process_input_file(self, session_id, group, file_name, file):
         """Processes an input file from Python or API.
 
-        It tries to find the referenced parameter and uploads the file to the session workspace.
+        It tries to find the referenced parameter and uploads the file to the session workspace. The file can be
+        a local file path, the file content as bytes-like object or a readable file object (streamed in chunks).
         """
         self._log.debug("Processing input file for parameter '%s'.", self.name)
         if self.file_data is None:
@@ -127,24 +159,30 @@ class Parameter:
             message = f"Corrupted parameter '{self.name}': Marked as file parameter but has no valid path."
             self._log.error(message)
             raise ValueError(message)
-        destination_path = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id), 'inputs', group, self.name)
+        destination_path, container_path = self.__create_input_dirs(session_id, group)
         destination_file = os.path.join(destination_path, file_name)
-        destination_path_obj = pathlib.Path(destination_path)
-        destination_path_obj.mkdir(parents=True, exist_ok=True)
-        if os.path.isfile(str(file)):
-            # native execution environment -> file can be uploaded with native os commands
-            shutil.copyfile(str(file), destination_file)
-        else:
-            # API call -> write stream to file
+        if hasattr(file, 'read'):
+            # API call with file object -> stream the content to file
             with open(destination_file, 'wb') as target_file:
-                target_file.write(file)
+                shutil.copyfileobj(file, target_file, 1024 * 1024)
+        elif isinstance(file, (bytes, bytearray, memoryview)):
+            # API call with file content -> write content to file without copying it
+            with open(destination_file, 'wb') as target_file:
+                target_file.write(memoryview(file))
+        else:
+            # native execution environment -> file can be uploaded with native os commands
+            try:
+                link_or_copy_file(os.fspath(file), destination_file)
+            except FileNotFoundError as exc:
+                message = f"Input file '{file}' for parameter '{self.name}' cannot be found."
+                self._log.error(message)
+                raise FileNotFoundError(message) from exc
         self.file_data.file_name = file_name
         # mark file as staged (file is available to SUNRISE Runtime Manager but not yet available in the
         # container workspace)
         self.file_data.file_state = FileState.STAGED
         # already create the path of the mounted file (perspective of the executing container)
-        target_mounted_dir = os.path.join(constants.CONTAINER_WORKDIR, 'inputs', group, self.name,
-                                          self.file_data.file_name)
+        target_mounted_dir = os.path.join(container_path, self.file_data.file_name)
         self.file_data.file_path_container = target_mounted_dir
         self.file_data.file_path_local = destination_file
         self._log.debug("Successfully saved file for parameter '%s' to temporary workspace path '%s'.", self.name,
@@ -170,21 +208,17 @@ class Parameter:
     def stage_file(self, session_id, group):
         """Stages the file by copying the file in the temporary folder of the SUNRISE Runtime Manager."""
         if self.file_data is not None:
-            if self.file_data.file_state == FileState.PENDING:
+            if self.file_data.file_state is FileState.PENDING:
                 # try to access parameter and check if file is accessible
                 # then copy file to temporary storage of SUNRISE Runtime Manager
                 if os.path.isfile(self.file_data.file_path_origin):
                     # native execution environment -> file can be uploaded with native os commands
                     self._log.info("Trying to stage pending file parameter '%s'.", self.name)
-                    destination_path = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id), 'inputs', group,
-                                                    self.name)
+                    destination_path, container_path = self.__create_input_dirs(session_id, group)
                     destination_file = os.path.join(destination_path, self.file_data.file_name)
-                    destination_path_obj = pathlib.Path(destination_path)
-                    destination_path_obj.mkdir(parents=True, exist_ok=True)
-                    shutil.copyfile(self.file_data.file_path_origin, destination_file)
+                    link_or_copy_file(self.file_data.file_path_origin, destination_file)
                     # already create the path of the mounted file (perspective of the executing container)
-                    target_mounted_dir = os.path.join(constants.CONTAINER_WORKDIR, 'inputs', group, self.name,
-                                                      self.file_data.file_name)
+                    target_mounted_dir = os.path.join(container_path, self.file_data.file_name)
                     self.file_data.file_path_container = target_mounted_dir
                     self.file_data.file_path_local = destination_file
                     self.file_data.file_state = FileState.STAGED
@@ -197,24 +231,19 @@ class Parameter:
                         request = urllib.request.Request(self.file_data.file_path_origin)
                         if self.file_data.credentials is not None:
                             request.add_header("Authorization", f"Bearer {self.file_data.credentials.decode('utf-8')}")
-                        with urllib.request.urlopen(request) as file:
-                            content = file.read()
-                        self._log.info("Successfully downloaded file from URL '%s'.", self.file_data.file_path_origin)
-                        destination_path = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id), 'inputs',
-                                                        group, self.name)
+                        destination_path, container_path = self.__create_input_dirs(session_id, group)
                         self.file_data.file_name = self.file_data.file_path_origin.split("/")[-1]
                         destination_file = os.path.join(destination_path, self.file_data.file_name)
-                        destination_path_obj = pathlib.Path(destination_path)
-                        destination_path_obj.mkdir(parents=True, exist_ok=True)
-                        with open(destination_file, 'wb') as target_file:
-                            target_file.write(content)
+                        # stream the download directly to the destination file
+                        with urllib.request.urlopen(request) as file, open(destination_file, 'wb') as target_file:
+                            shutil.copyfileobj(file, target_file, 1024 * 1024)
+                        self._log.info("Successfully downloaded file from URL '%s'.", self.file_data.file_path_origin)
                     except urllib.error.HTTPError as exc:
                         message = f"Unable to download file from URL '{self.file_data.file_path_origin}' for the "\
                                   f"parameter '{self.name}': {str(exc)}"
                         self._log.error(message)
                         raise FileNotFoundError(message) from exc
-                    target_mounted_dir = os.path.join(constants.CONTAINER_WORKDIR, 'inputs', group, self.name,
-                                                      self.file_data.file_name)
+                    target_mounted_dir = os.path.join(container_path, self.file_data.file_name)
                     self.file_data.file_path_container = target_mounted_dir
                     self.file_data.file_path_local = destination_file
                     self.file_data.file_state = FileState.STAGED
@@ -226,7 +255,7 @@ class Parameter:
                     self._log.error(message)
                     raise FileNotFoundError(message)
 
-            elif self.file_data.file_state == FileState.STAGED:
+            elif self.file_data.file_state is FileState.STAGED:
                 # file is ready to be copied to docker volume
                 self._log.info("File parameter '%s' is staged to temporary SUNRISE Runtime Manager storage.", self.name)
         else:
@@ -235,7 +264,7 @@ class Parameter:
     def mark_file_parameter_available(self):
         """Marks file parameter as available."""
         if self.file_data is not None:
-            if self.file_data.file_state == FileState.STAGED:
+            if self.file_data.file_state is FileState.STAGED:
                 self.file_data.file_state = FileState.AVAILABLE
 
     def update_parameter(self, new_value):
@@ -245,11 +274,31 @@ class Parameter:
         if isinstance(self.value, bool):
             if isinstance(new_value, bool):
                 self.value = new_value
-            elif new_value.lower() == 'true':
-                self.value = True
+            elif isinstance(new_value, str):
+                self.value = new_value.strip().casefold() in Parameter._true_strings
             else:
-                self.value = False
+                message = f"Parameter '{self.name}' is a boolean parameter and cannot be set to a value of type "\
+                          f"'{type(new_value).__name__}'."
+                self._log.error(message)
+                raise ValueError(message)
         else:
             # consider all other data types as string
             self.value = new_value
         self._log.info("Successfully updated parameter value.")
+
+    # parsers for meta data types of parameters which require a specific parsing
+    _meta_parsers = {dataformats.SysDefParameterFile: __parse_file_parameter}
+
+
+def stage_files_parallel(parameter_list: list[Parameter], session_id, group):
+    """Stages the files of all file parameters concurrently to overlap downloads and file copies.
+
+    An exception raised while staging a file is re-raised by this function.
+    """
+    file_parameters = [parameter for parameter in parameter_list if parameter.file_data is not None]
+    if len(file_parameters) == 0:
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(file_parameters))) as executor:
+        futures = [executor.submit(parameter.stage_file, session_id, group) for parameter in file_parameters]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
@@ -18,10 +18,15 @@ It is implemented as FastAPI application that provides REST endpoints.
 """
 
 import os
+import re
 import uuid
+import asyncio
+import contextlib
 import logging
 import pydantic
 import fastapi
+import fastapi.concurrency
+import fastapi.middleware.gzip
 import uvicorn
 import uvicorn.config
 import system
@@ -40,37 +45,95 @@ uvicorn.config.LOGGING_CONFIG["formatters"]["default"]["fmt"] = "%(asctime)s %(l
 uvicorn.config.LOGGING_CONFIG["formatters"]["access"]["fmt"] = '%(asctime)s %(levelprefix)s %(client_addr)s'\
                                                                ' - "%(request_line)s" %(status_code)s'
 
+
+@contextlib.asynccontextmanager
+async def lifespan(_: fastapi.FastAPI):
+    """Prepares the Runtime Manager before the first request is handled."""
+    # parse the system references once, so the first system request does not need to parse them
+    try:
+        system_db.systems.get_system_names()
+    except (OSError, pydantic.ValidationError) as exc:
+        log.warning("Unable to load the system references at startup: %s", exc)
+    yield
+
+
 # FastAPI application object for hosting REST API of SUNRISE Runtime Manager
 api_app = fastapi.FastAPI(
     title='SUNRISE Evaluation API (EvalAPI)',
     summary='Implementation of the EvalAPI to the SUNRISE Runtime Manager',
     description='In the SUNRISE framework, the EvalAPI is the interface for front-end users to the Runtime Manager.',
     contact={'name': 'SUNRISE Team', 'url': 'https://www.bosch.com/research/', 'email': 'sunrise@bosch.com'},
-    version=constants.SUNRISE_RUNTIME_MANAGER_VERSION
+    version=constants.SUNRISE_RUNTIME_MANAGER_VERSION,
+    # encode JSON responses with orjson instead of the standard library json module
+    default_response_class=fastapi.responses.ORJSONResponse,
+    lifespan=lifespan
 )
 
+# maximum time in seconds a request waits for a session state change
+MAX_STATE_WAIT_TIME_S = 60.0
+
+# session methods returning the parameters of a parameter group
+PARAMETER_GETTERS = {
+    system.ParameterGroupIdentifier.COMMON: session.Session.common_parameters,
+    system.ParameterGroupIdentifier.BUILD: session.Session.build_parameters,
+    system.ParameterGroupIdentifier.RUN: session.Session.run_parameters
+}
+
+# body of the version endpoint, encoded once as the version does not change (endpoint is used as health check)
+VERSION_BODY = constants.SUNRISE_RUNTIME_MANAGER_VERSION.encode('utf-8')
+
+
+class ResponseCompressionMiddleware:
+    """Compresses larger responses with gzip, except the downloads of result files.
+
+    Result files can be large (the compression would block the event loop) or are already compressed (e.g. FST traces),
+    so they are passed to the client unchanged.
+    """
+
+    _result_path_regex = re.compile(r'/session/[^/]+/result/[^/]+$')
+
+    def __init__(self, app, **options) -> None:
+        self._app = app
+        self._gzip_app = fastapi.middleware.gzip.GZipMiddleware(app, **options)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] == 'http' and self._result_path_regex.search(scope['path']):
+            await self._app(scope, receive, send)
+        else:
+            await self._gzip_app(scope, receive, send)
+
+
+# compress larger responses (e.g. SysDef and result lists), a low compression level is sufficient for JSON data
+api_app.add_middleware(ResponseCompressionMiddleware, minimum_size=1024, compresslevel=1)
+
+# serializer for result information lists, created once as it is used on every result list request
+RESULT_INFO_LIST_ADAPTER = pydantic.TypeAdapter(list[dataformats.ResultInfo])
+
 
 @api_app.get("/version", summary="Get the version of the Runtime Manager",
              response_class=fastapi.responses.PlainTextResponse, response_description="Version string")
-def get_version() -> str:
+async def get_version() -> fastapi.Response:
     """REST API endpoint to get the Runtime Manager version.
 
     Returns:
         version (str): The version of this Runtime Manager.
     """
-    log.info("The version of SUNRISE Runtime Manager is '%s'", constants.SUNRISE_RUNTIME_MANAGER_VERSION)
-    return constants.SUNRISE_RUNTIME_MANAGER_VERSION
+    log.debug("The version of SUNRISE Runtime Manager is '%s'", constants.SUNRISE_RUNTIME_MANAGER_VERSION)
+    # a response object must not be shared between requests, as middlewares can modify its headers
+    return fastapi.responses.PlainTextResponse(VERSION_BODY)
 
 
-@api_app.get("/session", summary="Get the IDs of all existing experiments",
+@api_app.get("/session", summary="Get the IDs of all existing experiments", response_model=list[uuid.UUID],
              response_description="List of experiment id strings")
-def get_sessions() -> list[uuid.UUID]:
+async def get_sessions() -> fastapi.Response:
     """REST API endpoint for listing all available sessions.
 
     Returns:
         session_ids (list[UUID]): List of all session IDs of available experiments.
     """
-    return session.SessionsHandler.available_sessions()
+    # the session ids are the names of the session directories -> serialize the strings without converting them
+    # to UUID objects and back
+    return fastapi.responses.ORJSONResponse(session.SessionsHandler.available_sessions())
 
 
 @api_app.post("/session", status_code=fastapi.status.HTTP_201_CREATED, summary="Create a new experiment",
@@ -92,9 +155,9 @@ def create_session(item: dataformats.CreateSessionItem = fastapi.Body(descriptio
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
-@api_app.get("/session/{session_id}", summary="Get experiment details",
+@api_app.get("/session/{session_id}", summary="Get experiment details", response_model=dataformats.SessionInfo,
              response_description="SessionInfo object for the experiment")
-def get_session(session_id: uuid.UUID) -> dataformats.SessionInfo:
+def get_session(session_id: uuid.UUID) -> fastapi.Response:
     """REST API endpoint to get information about a specific session.
 
     Parameters:
@@ -104,8 +167,9 @@ def get_session(session_id: uuid.UUID) -> dataformats.SessionInfo:
         session_info (dataformats.SessionInfo): An object containing information about the experiment session.
     """
     try:
-        with session.SessionsHandler(session_id) as session_data:
-            return session_data.get_info()
+        # serialized without a validation of the response model, cached as long as the session is unchanged
+        return fastapi.Response(session.SessionsHandler.get_session_info_json(session_id),
+                                media_type="application/json")
     except session.InvalidSessionError as exc:
         message = f"Got an invalid session id '{str(session_id)}': {str(exc)}"
         log.error(message)
@@ -150,16 +214,8 @@ def get_session_parameters(session_id: uuid.UUID,
         parameters (dict): Dictionary of parameters and values for the parameter group used in this session.
     """
     try:
-        with session.SessionsHandler(session_id) as session_data:
-            if group is system.ParameterGroupIdentifier.COMMON:
-                return session_data.common_parameters()
-            if group is system.ParameterGroupIdentifier.BUILD:
-                return session_data.build_parameters()
-            if group is system.ParameterGroupIdentifier.RUN:
-                return session_data.run_parameters()
-            # invalid parameter group if this point is reached
-            raise fastapi.HTTPException(status_code=fastapi.status.HTTP_404_NOT_FOUND,
-                                        detail=f"Invalid parameter group '{str(group)}'.")
+        with session.SessionsHandler(session_id, read_only=True) as session_data:
+            return PARAMETER_GETTERS[group](session_data)
     except Exception as exc:
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
@@ -182,7 +238,7 @@ def put_session_parameter(session_id: uuid.UUID, group: system.ParameterGroupIde
     try:
         with session.SessionsHandler(session_id) as session_data:
             # converting group identifier to real group name for internal processing
-            param_group = dataformats.ParameterGroup(group + "_parameters")
+            param_group = system.PARAMETER_GROUPS[group]
             session_data.update(param_group, parameter.name, parameter.value)
     except (NameError, ValueError) as exc:
         message = f"Update of parameter '{parameter.name}' in '{session_id}' failed: {str(exc)}"
@@ -213,8 +269,8 @@ def post_session_parameter(session_id: uuid.UUID, group: system.ParameterGroupId
     try:
         with session.SessionsHandler(session_id) as session_data:
             # converting group identifier to real group name for internal processing
-            param_group = dataformats.ParameterGroup(group + "_parameters")
-            session_data.add(param_group, parameter_name, file.filename, file.file.read())
+            param_group = system.PARAMETER_GROUPS[group]
+            session_data.add(param_group, parameter_name, file.filename, file.file)
     except (NameError, ValueError) as exc:
         message = f"File upload of parameter '{parameter_name}' in '{session_id}' failed: {str(exc)}"
         log.error(message)
@@ -246,7 +302,7 @@ def delete_session_parameter(session_id: uuid.UUID, group: system.ParameterGroup
     try:
         with session.SessionsHandler(session_id) as session_data:
             # converting group identifier to real group name for internal processing
-            param_group = dataformats.ParameterGroup(group + "_parameters")
+            param_group = system.PARAMETER_GROUPS[group]
             session_data.delete(param_group, parameter_name)
     except (NameError, ValueError) as exc:
         message = f"Deletion of parameter '{parameter_name}' in '{session_id}' failed: {str(exc)}"
@@ -269,16 +325,12 @@ def post_session_build(session_id: uuid.UUID, timeout: int = None) -> None:
         timeout (int): Optional timeout in seconds for this command.
     """
 
-    with session.SessionsHandler(session_id) as session_data:
-        status = session_data.status()
-    if status in [dataformats.State.RUNNING, dataformats.State.BUILDING]:
-        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_412_PRECONDITION_FAILED,
-                                    detail=f"Build not allowed since the session is in state {status}")
     try:
+        # the session state is checked by the execute call (an asynchronous call only fails on the state check)
         session.Session.execute(session_id, 'build', True, timeout)
     except session.UnexpectedSessionState as exc:
-        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR,
-                                    detail=str(exc)) from exc
+        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_412_PRECONDITION_FAILED,
+                                    detail=f"Build not allowed: {str(exc)}") from exc
 
 
 @api_app.post("/session/{session_id}/run", summary="Start the run-action of an experiment",
@@ -291,22 +343,13 @@ def post_session_run(session_id: uuid.UUID, timeout: int = None) -> None:
         timeout (int): Optional timeout in seconds for this command.
     """
 
-    with session.SessionsHandler(session_id) as session_data:
-        status = session_data.status()
-        has_build_command = session_data.system.has_build
-    if status in [dataformats.State.RUNNING, dataformats.State.BUILDING]:
-        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_412_PRECONDITION_FAILED,
-                                    detail=f"Run not allowed since the session is in state {status}")
-    # if the system has a build command, the build step must be successfully completed for the run command
-    if has_build_command and status not in [dataformats.State.BUILT, dataformats.State.RAN,
-                                            dataformats.State.FAILED_RUN]:
-        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_412_PRECONDITION_FAILED,
-                                    detail=f"Run not allowed since the session is in state {status}")
     try:
+        # the session state is checked by the execute call (an asynchronous call only fails on the state check)
+        # if the system has a build command, the build step must be successfully completed for the run command
         session.Session.execute(session_id, 'run', True, timeout)
     except session.UnexpectedSessionState as exc:
-        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR,
-                                    detail=str(exc)) from exc
+        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_412_PRECONDITION_FAILED,
+                                    detail=f"Run not allowed: {str(exc)}") from exc
 
 
 @api_app.post("/session/{session_id}/stop", summary="Stop the ongoing build-/run-action",
@@ -319,9 +362,11 @@ def post_session_stop(session_id: uuid.UUID) -> None:
     """
 
     try:
-        with session.SessionsHandler(session_id) as session_data:
+        # stopping the container does not modify the session, the executing thread updates the session state
+        # -> no exclusive lock required, which would compete with the log updates of the executing thread
+        with session.SessionsHandler(session_id, read_only=True) as session_data:
             status = session_data.status()
-            if status in [dataformats.State.RUNNING, dataformats.State.BUILDING]:
+            if status in session.ACTIVE_STATES:
                 session_data.stop()
             else:
                 # stop command is only allowed in a building or running state
@@ -347,16 +392,63 @@ def get_session_state(session_id: uuid.UUID) -> dataformats.State:
     """
 
     try:
-        with session.SessionsHandler(session_id) as session_data:
+        with session.SessionsHandler(session_id, read_only=True) as session_data:
             return session_data.status()
     except Exception as exc:
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR,
                                     detail=str(exc)) from exc
 
 
+@api_app.get("/session/{session_id}/status/wait", summary="Wait for a change of the experiment state",
+             response_description="The experiment state")
+async def get_session_state_change(session_id: uuid.UUID, state: dataformats.State,
+                                   timeout: float = MAX_STATE_WAIT_TIME_S) -> dataformats.State:
+    """REST API endpoint for waiting on a change of the session state (long polling).
+
+    The response is sent as soon as the session state differs from the provided state, but at the latest after
+    the timeout. This avoids polling the state repeatedly during a build or run command. Waiting requests do not
+    occupy a worker thread, the session state is only read again after the session was saved.
+
+    Parameters:
+        session_id (UUID): Session ID of the experiment.
+        state (dataformats.State): Last known state of the session.
+        timeout (float): Maximum waiting time in seconds (limited to 60 seconds).
+
+    Returns:
+        state (dataformats.State): Current state of requested session.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(max(timeout, 0.0), MAX_STATE_WAIT_TIME_S)
+    session_saved = asyncio.Event()
+
+    def notify_session_saved():
+        """Called by the thread which saved the session, wakes up the waiting request in the event loop."""
+        try:
+            loop.call_soon_threadsafe(session_saved.set)
+        except RuntimeError:
+            # event loop is already closed
+            pass
+
+    session.SessionsHandler.add_save_listener(session_id, notify_session_saved)
+    try:
+        while True:
+            # reset the event before the state is read, so a save during the read is not missed
+            session_saved.clear()
+            current_state = await fastapi.concurrency.run_in_threadpool(get_session_state, session_id)
+            remaining_time = deadline - loop.time()
+            if current_state is not state or remaining_time <= 0:
+                return current_state
+            try:
+                await asyncio.wait_for(session_saved.wait(), remaining_time)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        session.SessionsHandler.remove_save_listener(session_id, notify_session_saved)
+
+
 @api_app.get("/session/{session_id}/result", summary="Get a list with information about experiment results",
-             response_description="List of ResultInfo objects")
-def get_session_results(session_id: uuid.UUID) -> list[dataformats.ResultInfo]:
+             response_model=list[dataformats.ResultInfo], response_description="List of ResultInfo objects")
+def get_session_results(session_id: uuid.UUID) -> fastapi.Response:
     """REST API endpoint for getting a list containing the availability status for each result in the experiment.
 
     Parameters:
@@ -368,14 +460,16 @@ def get_session_results(session_id: uuid.UUID) -> list[dataformats.ResultInfo]:
     """
 
     try:
-        with session.SessionsHandler(session_id) as session_data:
+        # the availability is derived from the session data only -> no lock and no storing of the session required
+        with session.SessionsHandler(session_id, read_only=True) as session_data:
             result_info_list: list[dataformats.ResultInfo] = []
             for result_name, result_info in session_data.system.data.results.items():
                 is_available, optional_message = session_data.get_result_availability(result_name)
                 result_info = dataformats.ResultInfo(name=result_name, type=result_info.type,
                                                      is_available=is_available, message=optional_message)
                 result_info_list.append(result_info)
-            return result_info_list
+            # serialize the already validated models directly without a validation of the response model
+            return fastapi.Response(RESULT_INFO_LIST_ADAPTER.dump_json(result_info_list), media_type="application/json")
     except Exception as exc:
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc))
 
@@ -403,7 +497,10 @@ def get_session_result(session_id: uuid.UUID, name: str) -> fastapi.responses.Fi
             result = session_data.system.data.results[name]
             filename: os.PathLike = os.path.basename(result.path)
             datatype = result.type
-            return fastapi.responses.FileResponse(session_data.get_result(name), filename=filename, media_type=datatype)
+            result_path = session_data.get_result(name)
+            # pass the file status to the response, which otherwise reads it again in the event loop
+            return fastapi.responses.FileResponse(result_path, stat_result=os.stat(result_path), filename=filename,
+                                                  media_type=datatype)
     except (NameError, KeyError, FileNotFoundError, session.InvalidSessionError, session.ResultNotAvailable) as exc:
         message = f"Requested invalid result '{name}' from session id '{session_id}': {str(exc)}"
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_400_BAD_REQUEST, detail=message)
@@ -413,7 +510,7 @@ def get_session_result(session_id: uuid.UUID, name: str) -> fastapi.responses.Fi
 
 
 @api_app.get("/system", summary="List all available system names", response_description="List of name strings")
-def get_systems() -> list[str]:
+async def get_systems() -> list[str]:
     """REST API endpoint to get the list of available system names.
 
     Returns:
@@ -424,7 +521,7 @@ def get_systems() -> list[str]:
 
 @api_app.get("/system/{name}", summary="List all available versions of a system",
              response_description="List of version strings")
-def get_system_version(name: str) -> list[str]:
+async def get_system_version(name: str) -> list[str]:
     """REST API endpoint to get a list of available versions of a specific system.
 
     Parameters:
@@ -440,8 +537,9 @@ def get_system_version(name: str) -> list[str]:
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_404_NOT_FOUND, detail=message)
 
 
-@api_app.get("/system/{name}/{version}", summary="Get the SysDef of a system", response_description="SysDef object")
-def get_system_definition(name: str, version: str) -> dataformats.SysDef:
+@api_app.get("/system/{name}/{version}", summary="Get the SysDef of a system", response_model=dataformats.SysDef,
+             response_description="SysDef object")
+def get_system_definition(name: str, version: str) -> fastapi.Response:
     """REST API endpoint to get the definition of a system (SysDef).
 
     Parameters:
@@ -452,7 +550,9 @@ def get_system_definition(name: str, version: str) -> dataformats.SysDef:
         system_definition (SysDef): The system definition object.
     """
     try:
-        return system.System.get_system_definition(name, version)
+        # serialize the already validated model directly without a validation of the response model
+        return fastapi.Response(system.System.get_system_definition(name, version).model_dump_json(),
+                                media_type="application/json")
     except (FileNotFoundError, UnboundLocalError, OSError, RuntimeError, system_db.SystemNotFound, KeyError) as exc:
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_404_NOT_FOUND, detail=str(exc))
 
@@ -476,8 +576,27 @@ def get_system_description(name: str, version: str) -> str:
         raise fastapi.HTTPException(status_code=fastapi.status.HTTP_404_NOT_FOUND, detail=str(exc))
 
 
+@api_app.post("/system/reload", summary="Reload the system definitions and descriptions",
+              response_description="No response data")
+def post_system_reload() -> None:
+    """REST API endpoint to clear the cached system definitions and descriptions.
+
+    The next request of a system definition or description fetches it again from the system repository.
+    """
+    system.System.clear_system_cache()
+
+
 # start of uvicorn server for hosting the REST API
 if __name__ == "__main__":
     # setup loggers
     logging.config.fileConfig(os.path.join(constants.SUNRISE_RUNTIME_MANAGER_FULL_PATH, 'config', 'logging.conf'))
-    uvicorn.run(api_app, host="0.0.0.0", port=int(os.getenv('SUNRISE_RUNTIME_MANAGER_PORT', '8000')))
+    # optional limit of concurrent connections and tasks (further requests are answered with HTTP 503)
+    limit_concurrency = os.getenv('SUNRISE_RUNTIME_MANAGER_LIMIT_CONCURRENCY')
+    # use the uvloop event loop and the httptools parser (installed with 'fastapi[standard]') explicitly
+    # a single worker process is used, as the session storage is locked within the process
+    uvicorn.run(api_app, host="0.0.0.0", port=int(os.getenv('SUNRISE_RUNTIME_MANAGER_PORT', '8000')),
+                loop="uvloop", http="httptools",
+                # keep idle connections open between the requests of polling clients (uvicorn default is 5s)
+                timeout_keep_alive=int(os.getenv('SUNRISE_RUNTIME_MANAGER_KEEP_ALIVE', '30')),
+                backlog=int(os.getenv('SUNRISE_RUNTIME_MANAGER_BACKLOG', '2048')),
+                limit_concurrency=int(limit_concurrency) if limit_concurrency else None)
@@ -19,12 +19,17 @@ a simulation job.
 """
 
 import uuid
+import collections
 import dataclasses
 import datetime
 import pickle
+import io
+import itertools
 import os
+import re
 import logging
 import threading
+import typing
 import shutil
 import constants
 from dataformats import dataformats
@@ -32,6 +37,21 @@ import system
 import compute_if
 
 
+# session states with an ongoing build or run command
+ACTIVE_STATES = frozenset({dataformats.State.BUILDING, dataformats.State.RUNNING})
+
+# session states in which the system is built and can be run
+BUILT_STATES = frozenset({dataformats.State.BUILT, dataformats.State.RAN, dataformats.State.FAILED_RUN})
+
+# session states in which the build results are available
+BUILD_RESULT_STATES = BUILT_STATES | {dataformats.State.RUNNING}
+
+# session states which are reset by a parameter change of the build or run parameters
+BUILD_RESET_STATES = frozenset({dataformats.State.BUILT, dataformats.State.FAILED_BUILD, dataformats.State.RAN,
+                                dataformats.State.FAILED_RUN})
+RUN_RESET_STATES = frozenset({dataformats.State.RAN, dataformats.State.FAILED_RUN})
+
+
 class UnexpectedSessionState(Exception):
     """Will be raised if the session state is not in the expected state after an operation."""
 
@@ -48,13 +68,47 @@ class ResultNotAvailable(Exception):
     """Will be raised in case a result is requested which is not (yet) available."""
 
 
+class SessionUnpickler(pickle.Unpickler):
+    """Unpickler which only restores classes of the SUNRISE Runtime Manager and basic data types.
+
+    Session files must not be able to reference arbitrary callables, which would be executed while loading.
+    """
+
+    # globals which are stored in session files (key = module, value = names of the globals in this module)
+    _allowed_names = {
+        # session files of version 1.0 contain the handler of the session which saved the file
+        'session': ('Session', 'SessionDetails', 'SessionsHandler'),
+        'system': ('System', 'SystemIdentifier', 'SystemData'),
+        'parameters': ('Parameter', 'FileData', 'FileState'),
+        'compute_if': ('ComputeSystem', 'ComputeFile'),
+        'compute_docker': ('ComputeDocker',),
+        'dataformats.dataformats': ('State', 'ParameterGroup', 'SysDef', 'SysDefDoc', 'SysDefResult',
+                                    'SysDefCmplxParameter', 'SysDefParameterEnum', 'SysDefParameterRange',
+                                    'SysDefParameterFile', 'SysCfg', 'SysCfgSystem', 'SysCfgUrlParameter',
+                                    'LogEntry'),
+        'dataformats.resultformats': ('ResultTypes',),
+        'datetime': ('datetime',),
+        'uuid': ('UUID',),
+        'pathlib': ('PosixPath', 'PurePosixPath'),
+        'builtins': ('set', 'frozenset', 'bytearray'),
+        'logging': ('getLogger',)
+    }
+    _allowed_globals = frozenset((module, name) for module, names in _allowed_names.items() for name in names)
+
+    def find_class(self, module, name):
+        # dotted names are resolved as attribute path by pickle and could reach any global of an imported module
+        if '.' not in name and (module, name) in SessionUnpickler._allowed_globals:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Forbidden global '{module}.{name}' referenced in session file.")
+
+
 @dataclasses.dataclass
 class SessionDetails:
     """Contains additional information about a session."""
     display_name: str
     session_description: str
     creator_name: str
-    creation_date: str
+    creation_date: datetime.datetime
     remote: bool = None
 
     @classmethod
@@ -63,14 +117,35 @@ class SessionDetails:
         inst = cls(display_name=create_data.display_name if create_data.display_name else "",
                    session_description=create_data.description if create_data.description else "",
                    creator_name=create_data.creator if create_data.creator else "",
-                   creation_date=str(datetime.datetime.now()),
+                   creation_date=datetime.datetime.now(),
                    remote=create_data.remote)
         return inst
 
 
+@dataclasses.dataclass(slots=True)
+class ParameterData:
+    """Data derived from the parameters of a session, created on request and reset if the parameters change."""
+    # current system configuration
+    system_config: dataformats.SysCfg = None
+    # availability of results (key = result name, value = session state of the check and check result)
+    result_availability: dict[str, tuple[dataformats.State, bool, str]] = dataclasses.field(default_factory=dict)
+
+
 class Session:
     """Represents a session instance and provides all public operations on a session."""
 
+    # session state after a parameter change (key = changed parameter group, current session state and
+    # whether the system has a build command), the session state is not changed for all other combinations
+    _state_transitions: dict[tuple[dataformats.ParameterGroup, dataformats.State, bool], dataformats.State] = {
+        **{(parameter_group, state, has_build): dataformats.State.CREATED if has_build else dataformats.State.BUILT
+           for parameter_group in (dataformats.ParameterGroup.COMMON, dataformats.ParameterGroup.BUILD)
+           for state in BUILD_RESET_STATES
+           for has_build in (True, False)},
+        **{(dataformats.ParameterGroup.RUN, state, has_build): dataformats.State.BUILT
+           for state in RUN_RESET_STATES
+           for has_build in (True, False)}
+    }
+
     def __init__(self, session_id: uuid.UUID, syscfg: dataformats.SysCfg, details: SessionDetails) -> None:
         """Creates a new session instance."""
         # get sunrise session logger
@@ -88,21 +163,32 @@ class Session:
             self.state = dataformats.State.BUILT
         self.session_id = session_id
         self.log_entries: list[dataformats.LogEntry] = []
+        # data derived from the parameters (not stored in the session file)
+        self._parameter_data = ParameterData()
 
     def __getstate__(self):
         """Defines which data of this class can be serialized by pickle."""
         # copy the object state which contains all instance attributes
         state = self.__dict__.copy()
-        # remove the unpicklable entries
+        # remove the unpicklable entries and the reference to the handler of the opened session
         del state['_log']
+        state.pop('_parameter_data', None)
+        state.pop('session_handler', None)
         return state
 
     def __setstate__(self, state):
         """Defines which data of this class can be deserialized by pickle."""
-        # restore instance attributes
+        # restore instance attributes (the handler of the session which saved a session file of version 1.0 is
+        # not used anymore)
+        state.pop('session_handler', None)
         self.__dict__.update(state)
         # restore unpicklable entries
         self._log = logging.getLogger('sunrise.session')
+        self._parameter_data = ParameterData()
+
+    def reset_parameter_data(self):
+        """Resets the data derived from the parameters, required whenever parameters or their files are changed."""
+        self._parameter_data = ParameterData()
 
     def remove(self):
         """Removes the used resources of this session."""
@@ -111,28 +197,21 @@ class Session:
     def __update_state_after_param_change(self, changed_param_group):
         """Updates the session state if required after a parameter value has been changed."""
         previous_state = self.state
-        if changed_param_group in (dataformats.ParameterGroup.COMMON, dataformats.ParameterGroup.BUILD):
-            if self.state in (dataformats.State.BUILT, dataformats.State.FAILED_BUILD,
-                              dataformats.State.RAN, dataformats.State.FAILED_RUN):
-                if self.system.has_build:
-                    self.state = dataformats.State.CREATED
-                else:
-                    self.state = dataformats.State.BUILT
-        elif changed_param_group == dataformats.ParameterGroup.RUN:
-            if self.state in (dataformats.State.RAN, dataformats.State.FAILED_RUN):
-                self.state = dataformats.State.BUILT
-        if previous_state != self.state:
+        self.state = Session._state_transitions.get((changed_param_group, previous_state, self.system.has_build),
+                                                    previous_state)
+        if previous_state is not self.state:
             self._log.info("Parameter update changed session state from '%s' to '%s'", previous_state, self.state)
 
     def update(self, parameter_group, parameter_name, parameter_value):
         """Updates a specific parameter with a new value. The updated SysCfg file will be returned."""
         # it is not allowed to update a parameter during command execution
-        if self.state in (dataformats.State.BUILDING, dataformats.State.RUNNING):
+        if self.state in ACTIVE_STATES:
             raise LockedSessionError
         # check if parameter is part of parsed parameters from system definition and system configuration files
         parameter = self.system.get_parameter(parameter_group, parameter_name)
         if parameter is not None:
             parameter.update_parameter(parameter_value)
+            self.reset_parameter_data()
             # update session state depending on parameter group
             self.__update_state_after_param_change(parameter_group)
         else:
@@ -141,9 +220,12 @@ class Session:
             raise ValueError(message)
 
     def add(self, parameter_group, parameter_name, file_name, file):
-        """Adds a file for a specific file parameter."""
+        """Adds a file for a specific file parameter.
+
+        The file can be a local file path, the file content as bytes-like object or a readable file object.
+        """
         # it is not allowed to add a file parameter during command execution
-        if self.state in (dataformats.State.BUILDING, dataformats.State.RUNNING):
+        if self.state in ACTIVE_STATES:
             raise LockedSessionError
         # check if parameter is part of parsed parameters from system definition and system configuration files
         parameter = self.system.get_parameter(parameter_group, parameter_name)
@@ -151,6 +233,7 @@ class Session:
             self._log.info("Processing 'add' command for file parameter '%s' of parameter group '%s'...",
                            parameter_name, parameter_group)
             parameter.process_input_file(self.session_id, parameter_group, file_name, file)
+            self.reset_parameter_data()
         else:
             message = f"Selected parameter '{parameter_name}' in parameter group '{parameter_group}'"\
                        " is not part of system definition."
@@ -166,6 +249,7 @@ class Session:
             self._log.info("Processing 'delete' command for parameter '%s' of parameter group '%s'...",
                            parameter_name, parameter_group)
             parameter.reset()
+            self.reset_parameter_data()
         else:
             message = f"Selected parameter '{parameter_name}' in parameter group '{parameter_group}'"\
                        " is not part of system definition."
@@ -175,24 +259,20 @@ class Session:
         self.__update_state_after_param_change(parameter_group)
 
     @staticmethod
-    def __execute_precondition_check(session_id, command):
+    def __execute_precondition_check(session, command):
         """Precondition checks if command can be executed in the current session state."""
-        with SessionsHandler(session_id) as session:
-            # check if there is already a build or run command active
-            if session.state in (dataformats.State.BUILDING, dataformats.State.RUNNING):
-                raise UnexpectedSessionState(
-                    f"Cannot execute '{command}' as session is already 'building' or 'running'!")
-            # if the system has a build command, the build step must be successfully completed for
-            # the run command. If there is no build command it doesn't matter what the current session state is.
-            if command == 'run' and session.system.has_build and session.state not in (
-               dataformats.State.BUILT, dataformats.State.RAN, dataformats.State.FAILED_RUN):
-                raise UnexpectedSessionState("Cannot execute 'run' as session state is not 'built' or 'ran'!")
+        # check if there is already a build or run command active
+        if session.state in ACTIVE_STATES:
+            raise UnexpectedSessionState(
+                f"Cannot execute '{command}' as session is already 'building' or 'running'!")
+        # if the system has a build command, the build step must be successfully completed for
+        # the run command. If there is no build command it doesn't matter what the current session state is.
+        if command == 'run' and session.system.has_build and session.state not in BUILT_STATES:
+            raise UnexpectedSessionState("Cannot execute 'run' as session state is not 'built' or 'ran'!")
 
     @staticmethod
     def execute(session_id, command: str, async_call: bool = False, timeout: int = None):
         """Executes the system for the build or run command."""
-        Session.__execute_precondition_check(session_id, command)
-
         state_mapping = {
             'build': (dataformats.State.BUILDING, dataformats.State.BUILT, dataformats.State.FAILED_BUILD,
                       f"{session_id}_build"),
@@ -205,16 +285,18 @@ class Session:
 
         initial_state, success_state, failure_state, name = state_mapping[command]
 
-        # make first log entry in session to show start of command
+        # check the session state and make first log entry in session to show start of command with a single
+        # session access
         with SessionsHandler(session_id) as session:
+            Session.__execute_precondition_check(session, command)
             session.log_entries.append(dataformats.LogEntry(
                     timestamp=datetime.datetime.now(),
                     producer=f"container.{command}",
                     message="--- starting execution ---\n"))
+            if async_call:
+                session.state = initial_state
 
         if async_call:
-            with SessionsHandler(session_id) as session:
-                session.state = initial_state
             target = Session.__execute_async
             thread = threading.Thread(target=target, args=(session_id, command, timeout), name=name)
             thread.start()
@@ -231,6 +313,8 @@ class Session:
                 output = str(exc)
                 session.state = failure_state
                 session.log_entries[-1].message += output
+            # the execution changes the state of file parameters
+            session.reset_parameter_data()
             if not output:
                 session.log_entries[-1].message += f"No output generated by {command} command."
             if session.state is not success_state:
@@ -242,19 +326,24 @@ class Session:
     def __execute_async(session_id, command: str, timeout: int = None):
         """This method is called as thread to execute the system asynchronously."""
         try:
-            def write_to_log(_, message: str):
-                """Implements progress callback for compute backend. Messages will be written to session log."""
-                try:
-                    with SessionsHandler(session_id) as session:
-                        session.log_entries[-1].message += message
-                except (LockedSessionError, InvalidSessionError) as exc:
-                    message = f"Cannot write log entry for session id '{session_id}': {str(exc)}"
-                    logging.error(message)
-
-            # special invocation of execute method in read only mode to allow progress callback to update session log
-            with SessionsHandler(session_id, read_only=True) as session:
-                output = session.system.execute(command, timeout, write_to_log)
+            # progress messages are appended to the progress log file to avoid saving the whole session for each
+            # message, the file is merged into the session log after the execution
+            with open(SessionsHandler.get_progress_log_path(session_id), 'w', encoding='utf-8') as progress_log:
+                def write_to_log(_, message: str):
+                    """Implements progress callback for compute backend. Messages will be written to session log."""
+                    try:
+                        progress_log.write(message)
+                        progress_log.flush()
+                    except OSError as exc:
+                        message = f"Cannot write log entry for session id '{session_id}': {str(exc)}"
+                        logging.error(message)
+
+                # special invocation of execute method in read only mode to allow access to the session during the
+                # execution
+                with SessionsHandler(session_id, read_only=True) as session:
+                    output = session.system.execute(command, timeout, write_to_log)
             with SessionsHandler(session_id) as session:
+                session.merge_progress_log()
                 # check if progress callback was used by backend, otherwise use returned output for session log
                 if session.log_entries[-1].message == "--- starting execution ---\n":
                     if not output:
@@ -267,12 +356,33 @@ class Session:
         # pylint: disable=broad-exception-caught
         except Exception as exc:
             with SessionsHandler(session_id) as session:
+                session.merge_progress_log()
                 session.log_entries[-1].message += str(exc)
                 if command == 'build':
                     session.state = dataformats.State.FAILED_BUILD
                 else:
                     session.state = dataformats.State.FAILED_RUN
 
+    def read_progress_log(self) -> str:
+        """Returns the progress messages of the currently or last executed command which are not yet in the log."""
+        try:
+            # the file is read while it is written, so it might end with an incomplete character
+            with open(SessionsHandler.get_progress_log_path(self.session_id), encoding='utf-8',
+                      errors='replace') as file:
+                return file.read()
+        except FileNotFoundError:
+            return ""
+
+    def merge_progress_log(self):
+        """Moves the progress messages of the executed command into the last session log entry."""
+        progress_messages = self.read_progress_log()
+        if progress_messages:
+            self.log_entries[-1].message += progress_messages
+        try:
+            os.remove(SessionsHandler.get_progress_log_path(self.session_id))
+        except FileNotFoundError:
+            pass
+
     def stop(self):
         """Stops a running system."""
         self.system.stop()
@@ -281,23 +391,39 @@ class Session:
         """Returns the current session state."""
         return self.state
 
+    def __get_system_config(self) -> dataformats.SysCfg:
+        """Returns the current system configuration, which is created once until the parameters are changed."""
+        if self._parameter_data.system_config is None:
+            self._parameter_data.system_config = self.system.get_current_system_config()
+        return self._parameter_data.system_config
+
     def common_parameters(self):
         """Returns the list session parameters."""
-        syscfg = self.system.get_current_system_config()
+        syscfg = self.__get_system_config()
         return syscfg.common_parameters
 
     def build_parameters(self):
         """Returns the list session parameters."""
-        syscfg = self.system.get_current_system_config()
+        syscfg = self.__get_system_config()
         return syscfg.build_parameters
 
     def run_parameters(self):
         """Returns the list session parameters."""
-        syscfg = self.system.get_current_system_config()
+        syscfg = self.__get_system_config()
         return syscfg.run_parameters
 
     def get_result_availability(self, name: str) -> tuple[bool, str]:
         """Returns True if the result is available, otherwise False with a description will be returned."""
+        # the availability only depends on the session state and the parameters
+        availability = self._parameter_data.result_availability.get(name)
+        if availability is not None and availability[0] is self.state:
+            return availability[1], availability[2]
+        result_found, message = self.__check_result_availability(name)
+        self._parameter_data.result_availability[name] = (self.state, result_found, message)
+        return result_found, message
+
+    def __check_result_availability(self, name: str) -> tuple[bool, str]:
+        """Checks if the result is available for the current session state and parameters."""
         result = self.system.data.results[name]
         if isinstance(result, dataformats.SysDefResult):
             enabled_by = result.enabled_by
@@ -306,8 +432,9 @@ class Session:
         # parse enabled_by list in case it is present
         if enabled_by is not None:
             for enable_entry in enabled_by:
-                parameter_name = enable_entry.split('/')[-1]
-                parameter_group = dataformats.ParameterGroup(enable_entry.split('/')[-2])
+                # entry is a parameter path ending with '<parameter group>/<parameter name>'
+                parameter_group_name, parameter_name = enable_entry.split('/')[-2:]
+                parameter_group = dataformats.ParameterGroup(parameter_group_name)
                 parameter = self.system.get_parameter(parameter_group, parameter_name)
                 if isinstance(parameter.value, bool):
                     if not parameter.value:
@@ -318,14 +445,13 @@ class Session:
                     message = f"Result '{name}' cannot be generated: Required parameter '{parameter.name}' is not "\
                                "a boolean type. The SysDef is invalid for this result."
                     return False, message
-                if parameter_group == dataformats.ParameterGroup.BUILD:
-                    if self.state not in (dataformats.State.BUILT, dataformats.State.RUNNING, dataformats.State.RAN,
-                                          dataformats.State.FAILED_RUN):
+                if parameter_group is dataformats.ParameterGroup.BUILD:
+                    if self.state not in BUILD_RESULT_STATES:
                         message = f"Result '{name}' is not available: Session state is '{str(self.state)}' but "\
                                   f"at least '{str(dataformats.State.BUILT)}' is required."
                         return False, message
-                if parameter_group == dataformats.ParameterGroup.RUN:
-                    if self.state not in dataformats.State.RAN:
+                if parameter_group is dataformats.ParameterGroup.RUN:
+                    if self.state is not dataformats.State.RAN:
                         message = f"Result '{name}' is not available: Session state is '{str(self.state)}' but "\
                                   f"at least '{str(dataformats.State.RAN)}' is required."
                         return False, message
@@ -353,6 +479,13 @@ class Session:
 
     def get_info(self):
         """Returns information about the provided session id."""
+        session_logs = self.log_entries
+        # add the progress messages of a command which is currently executed
+        progress_messages = self.read_progress_log()
+        if progress_messages:
+            last_entry = session_logs[-1]
+            session_logs = session_logs[:-1] + [last_entry.model_copy(
+                update={'message': last_entry.message + progress_messages})]
         session_info = dataformats.SessionInfo(
             display_name=self.details.display_name,
             creation_date=self.details.creation_date,
@@ -361,12 +494,56 @@ class Session:
             session_state=self.state,
             system_name=self.system.system_id.name,
             system_version=self.system.system_id.version,
-            session_logs=self.log_entries,
-            syscfg=self.system.get_current_system_config()
+            session_logs=session_logs,
+            syscfg=self.__get_system_config()
         )
         return session_info
 
 
+class LruCache:
+    """Thread-safe mapping which only keeps a limited number of recently used entries."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the value of the key (None if there is no entry) and marks the entry as recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Sets the value of the key and removes the least recently used entries exceeding the maximum size."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        """Removes the entry of the key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SessionFilePaths:
+    """Paths of the files in which a session is stored."""
+    session_file: str
+    version_marker_file: str
+
+    @classmethod
+    def from_session_id(cls, session_id):
+        """Returns the file paths of the session with the session id."""
+        session_dir = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id))
+        return cls(session_file=os.path.join(session_dir, SessionsHandler.SESSION_FILE_NAME),
+                   version_marker_file=os.path.join(session_dir, SessionsHandler.SESSION_VERSION_FILE_NAME))
+
+
 class SessionsHandler:
     """Sessions handling of the SUNRISE Runtime Manager."""
 
@@ -376,9 +553,34 @@ class SessionsHandler:
     # name of the session data version file
     SESSION_VERSION_FILE_NAME = 'sunrise_runtime_manager_version'
 
+    # name of the file with the progress messages of the currently executed command
+    PROGRESS_LOG_FILE_NAME = 'progress_log'
+
+    # regular expression to match a session id (name of a session directory) in the format of str(uuid.UUID)
+    _session_id_regex = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
     # contains all opened sessions (key = session id, value = threading lock)
     _opened_sessions: dict[str, threading.Lock] = {}
 
+    # callbacks which are called after a session file was saved, e.g. to wait for session state changes
+    # (key = session id, value = callbacks)
+    _save_listeners: dict[str, set[typing.Callable[[], None]]] = {}
+    _save_listeners_lock = threading.Lock()
+
+    # generation of the last save of a session file (key = session id, value = generation), the generations are
+    # unique within the process, as a replaced session file can get the same file status (e.g. inode and a coarse
+    # modification time)
+    _save_generations: dict[str, int] = {}
+    _save_generation_counter = itertools.count(1)
+
+    # recently loaded sessions (key = session id, value = session file status, pickled session data and session
+    # object of the last writer or None)
+    _loaded_sessions = LruCache(64)
+
+    # recently serialized session information (key = session id, value = session and progress log file status and
+    # SessionInfo as JSON)
+    _session_info_cache = LruCache(256)
+
     def __init__(self, session_id, read_only=False, force=False) -> None:
         # get sunrise session logger
         self._log = logging.getLogger('sunrise.session')
@@ -386,6 +588,10 @@ class SessionsHandler:
         self.read_only = read_only
         self.force = force
         self.session = None
+        # content of the session file when it was opened (used to skip saving an unchanged session)
+        self.session_file_data = None
+        # paths of the session files
+        self.file_paths = SessionFilePaths.from_session_id(session_id)
         if not os.path.isdir(constants.SESSIONS_BASE_DIR):
             os.makedirs(constants.SESSIONS_BASE_DIR)
 
@@ -410,15 +616,12 @@ class SessionsHandler:
         session_data = Session(session_id, create_session_item.syscfg, session_details)
 
         # create a new session file for non-volatile storage of session data
-        session_file_path = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id),
-                                         SessionsHandler.SESSION_FILE_NAME)
-        with open(session_file_path, 'wb') as file:
-            pickle.dump(session_data, file)
+        file_paths = SessionFilePaths.from_session_id(session_id)
+        with open(file_paths.session_file, 'wb') as file:
+            pickle.dump(session_data, file, protocol=pickle.HIGHEST_PROTOCOL)
 
         # add a file with the version of the SUNRISE Runtime Manager to enable compatibility checks of the pickled file
-        version_marker_file = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id),
-                                           SessionsHandler.SESSION_VERSION_FILE_NAME)
-        with open(version_marker_file, mode="w", encoding="utf-8") as file:
+        with open(file_paths.version_marker_file, mode="w", encoding="utf-8") as file:
             file.write(constants.SUNRISE_RUNTIME_MANAGER_VERSION)
 
         return session_id
@@ -426,11 +629,8 @@ class SessionsHandler:
     def __open_storage_file(self, read_only: bool = False, force: bool = False):
         """Opens the storage file for the session id and locks the file to avoid manipulation by another thread."""
         # get session lock for exclusive session file access if write access is requested
-        if self.session_id in SessionsHandler._opened_sessions:
-            session_look = SessionsHandler._opened_sessions[self.session_id]
-        else:
-            session_look = threading.Lock()
-            SessionsHandler._opened_sessions[self.session_id] = session_look
+        # (setdefault is atomic, so concurrent opens of a session always get the same lock)
+        session_look = SessionsHandler._opened_sessions.setdefault(str(self.session_id), threading.Lock())
         if not read_only:
             # exclusive lock required for write operations on session
             if session_look.locked() and force:
@@ -442,58 +642,157 @@ class SessionsHandler:
                 self._log.error(message)
                 raise LockedSessionError(message)
 
-        session_file_path = os.path.join(constants.SESSIONS_BASE_DIR, str(self.session_id),
-                                         SessionsHandler.SESSION_FILE_NAME)
-
-        if not os.path.isfile(session_file_path):
+        try:
+            file_status = SessionsHandler.__get_session_file_status(self.session_id, self.file_paths)
+        except FileNotFoundError as exc:
             message = f"No session file found for session id '{str(self.session_id)}'."
             self._log.error(message)
-            raise InvalidSessionError(message)
+            raise InvalidSessionError(message) from exc
 
+        # reuse the pickled session data and the session object of the last writer if the session file was not
+        # saved since it was loaded
+        loaded_session = SessionsHandler._loaded_sessions.get(str(self.session_id))
+        if loaded_session is not None and loaded_session[0] == file_status:
+            _, session_file_data, session_data = loaded_session
+        else:
+            session_file_data = self.__read_storage_file()
+            session_data = None
+        # read-only accesses always get their own session object, so they never see the changes of a writer before
+        # they are saved and a writer never sees the changes of a read-only access
+        if read_only or session_data is None:
+            session_data = self.__load_storage_file(session_file_data)
+        if not read_only:
+            self.session_file_data = session_file_data
+            SessionsHandler._loaded_sessions.put(str(self.session_id), (file_status, session_file_data, session_data))
+        elif loaded_session is None or loaded_session[0] != file_status:
+            SessionsHandler._loaded_sessions.put(str(self.session_id), (file_status, session_file_data, None))
+        session_data.session_handler = self
+        return session_data
+
+    @staticmethod
+    def __get_session_file_status(session_id, file_paths: SessionFilePaths) -> tuple:
+        """Returns the save generation and the file status of the session file to detect whether it was saved.
+
+        The generation is read before the session file, so a status never belongs to older session data than the data
+        read afterwards. The file status detects changes of the session file outside of this process.
+        """
+        generation = SessionsHandler._save_generations.get(str(session_id), 0)
+        file_stat = os.stat(file_paths.session_file)
+        return generation, file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+    def __read_storage_file(self) -> bytes:
+        """Reads the pickled session data from the storage file."""
         # check if pickled session data file was created with this SUNRISE Runtime Manager version
-        version_marker_file = os.path.join(constants.SESSIONS_BASE_DIR, str(self.session_id),
-                                           SessionsHandler.SESSION_VERSION_FILE_NAME)
-        with open(version_marker_file, mode="r", encoding="utf-8") as file:
-            version = str.strip(file.readline())
-        if version != constants.SUNRISE_RUNTIME_MANAGER_VERSION:
+        with open(self.file_paths.version_marker_file, mode="rb") as file:
+            version = file.readline().strip()
+        if version != constants.SUNRISE_RUNTIME_MANAGER_VERSION.encode('utf-8'):
             self._log.warning("The session file was created with a different SUNRISE Runtime Manager version: "
                               "Read version is '%s', expected version is '%s'! Trying to parse the session file "
-                              "but errors might occur.", version, constants.SUNRISE_RUNTIME_MANAGER_VERSION)
+                              "but errors might occur.", version.decode('utf-8', errors='replace'),
+                              constants.SUNRISE_RUNTIME_MANAGER_VERSION)
 
-        session_data: Session
-        with open(os.path.join(session_file_path), 'rb') as file:
-            try:
-                session_data = pickle.load(file)
-            except ModuleNotFoundError as exc:
-                message = f"Cannot load session file for session id '{str(self.session_id)}'."\
-                           "The session might be created with an older or newer version of SUNRISE Runtime Manager "\
-                           f"and could be now incompatible with this version. Problematic module is: {str(exc)}"
-                self._log.error(message)
-                raise InvalidSessionError(message) from exc
-            except compute_if.ComputeResourceUnavailableError as exc:
-                message = f"Cannot open the session volume: {str(exc)}"
-                self._log.error(message)
-                raise InvalidSessionError(message) from exc
+        with open(self.file_paths.session_file, 'rb') as file:
+            return file.read()
 
-        session_data.session_handler = self
-        return session_data
+    def __load_storage_file(self, session_file_data: bytes) -> Session:
+        """Loads the session object from the pickled session data."""
+        try:
+            return SessionUnpickler(io.BytesIO(session_file_data)).load()
+        # pickled data of another version might not match the current classes (e.g. slots or changed attributes)
+        except (ModuleNotFoundError, pickle.UnpicklingError, AttributeError, TypeError) as exc:
+            message = f"Cannot load session file for session id '{str(self.session_id)}'."\
+                       "The session might be created with an older or newer version of SUNRISE Runtime Manager "\
+                       f"and could be now incompatible with this version. Problematic module is: {str(exc)}"
+            self._log.error(message)
+            raise InvalidSessionError(message) from exc
+        except compute_if.ComputeResourceUnavailableError as exc:
+            message = f"Cannot open the session volume: {str(exc)}"
+            self._log.error(message)
+            raise InvalidSessionError(message) from exc
 
     def __close_storage_file(self, read_only: bool = False):
         """Closes the storage file for the session and releases the file lock to allow modification by other threads."""
         if not read_only:
-            session_file_path = os.path.join(constants.SESSIONS_BASE_DIR, str(self.session_id),
-                                             SessionsHandler.SESSION_FILE_NAME)
-            if not os.path.isfile(session_file_path):
+            if not os.path.isfile(self.file_paths.session_file):
                 message = f"No session file found for session id '{str(self.session_id)}'."
                 self._log.error(message)
                 raise InvalidSessionError(message)
 
-            # save session data to session file
-            with open(os.path.join(session_file_path), 'wb') as file:
-                pickle.dump(self.session, file)
+            # the session object of the writer is only reused by the next writer if it was saved successfully
+            SessionsHandler._loaded_sessions.pop(str(self.session_id))
+            # save session data only if it was changed while the session was opened
+            session_file_data = pickle.dumps(self.session, protocol=pickle.HIGHEST_PROTOCOL)
+            if session_file_data != self.session_file_data:
+                # save session data to a temporary file and replace the session file with it, so read-only
+                # accesses never read a partially written session file
+                temporary_file_path = self.file_paths.session_file + '.tmp'
+                with open(temporary_file_path, 'wb') as file:
+                    file.write(session_file_data)
+                os.replace(temporary_file_path, self.file_paths.session_file)
+                # the generation is increased after the session file was replaced, so a concurrent read of the old
+                # generation and the new data only leads to a cache miss on the next access
+                SessionsHandler._save_generations[str(self.session_id)] = \
+                    next(SessionsHandler._save_generation_counter)
+                with SessionsHandler._save_listeners_lock:
+                    listeners = list(SessionsHandler._save_listeners.get(str(self.session_id), ()))
+                for listener in listeners:
+                    listener()
+            file_status = SessionsHandler.__get_session_file_status(self.session_id, self.file_paths)
+            SessionsHandler._loaded_sessions.put(str(self.session_id), (file_status, session_file_data, self.session))
+            self.session_file_data = None
 
             # release lock on this session file
-            SessionsHandler._opened_sessions[self.session_id].release()
+            SessionsHandler._opened_sessions[str(self.session_id)].release()
+
+    @staticmethod
+    def add_save_listener(session_id, callback: typing.Callable[[], None]):
+        """Adds a callback which is called by the saving thread whenever the session file was saved."""
+        with SessionsHandler._save_listeners_lock:
+            SessionsHandler._save_listeners.setdefault(str(session_id), set()).add(callback)
+
+    @staticmethod
+    def remove_save_listener(session_id, callback: typing.Callable[[], None]):
+        """Removes a callback added by add_save_listener()."""
+        with SessionsHandler._save_listeners_lock:
+            listeners = SessionsHandler._save_listeners.get(str(session_id))
+            if listeners is not None:
+                listeners.discard(callback)
+                if not listeners:
+                    del SessionsHandler._save_listeners[str(session_id)]
+
+    @staticmethod
+    def get_progress_log_path(session_id) -> str:
+        """Returns the path of the file with the progress messages of the currently executed command."""
+        return os.path.join(constants.SESSIONS_BASE_DIR, str(session_id), SessionsHandler.PROGRESS_LOG_FILE_NAME)
+
+    @staticmethod
+    def get_session_info_json(session_id) -> bytes:
+        """Returns the information about a session as serialized SessionInfo object (JSON).
+
+        The serialized information is cached until the session file is saved, so repeated requests of an
+        unchanged session do not need to load the session.
+        """
+        try:
+            # the generation changes on every save of the session file
+            file_status = SessionsHandler.__get_session_file_status(session_id,
+                                                                    SessionFilePaths.from_session_id(session_id))
+        except FileNotFoundError as exc:
+            message = f"No session file found for session id '{str(session_id)}'."
+            logging.getLogger('sunrise.session').error(message)
+            raise InvalidSessionError(message) from exc
+        # the progress log file is only appended -> modification time and size identify the content
+        try:
+            progress_log_stat = os.stat(SessionsHandler.get_progress_log_path(session_id))
+            file_status += (progress_log_stat.st_mtime_ns, progress_log_stat.st_size)
+        except FileNotFoundError:
+            pass
+        cached_info = SessionsHandler._session_info_cache.get(str(session_id))
+        if cached_info is not None and cached_info[0] == file_status:
+            return cached_info[1]
+        with SessionsHandler(session_id, read_only=True) as session:
+            session_info_json = session.get_info().model_dump_json().encode('utf-8')
+        SessionsHandler._session_info_cache.put(str(session_id), (file_status, session_info_json))
+        return session_info_json
 
     @staticmethod
     def remove_session(session_id, force: bool = False):
@@ -508,17 +807,26 @@ class SessionsHandler:
         finally:
             if remove_approved:
                 # remove lock object from session handle object
-                del SessionsHandler._opened_sessions[session_id]
+                del SessionsHandler._opened_sessions[str(session_id)]
+                SessionsHandler._loaded_sessions.pop(str(session_id))
+                SessionsHandler._session_info_cache.pop(str(session_id))
+                SessionsHandler._save_generations.pop(str(session_id), None)
                 # remove session from filesystem
                 session_path = os.path.join(constants.SESSIONS_BASE_DIR, str(session_id))
-                if os.path.isdir(session_path):
+                try:
                     shutil.rmtree(session_path)
+                except FileNotFoundError:
+                    pass
 
     @staticmethod
     def available_sessions() -> list[str]:
         """Returns a list with all available sessions."""
         session_ids = []
-        # iterate over all folders in session base folder to get available session ids
+        # iterate over all folders in session base folder to get available session ids (the entry type is
+        # usually known from the directory listing without an additional stat call), other folders in the session
+        # base folder are ignored
         if os.path.isdir(constants.SESSIONS_BASE_DIR):
-            session_ids = list(os.listdir(constants.SESSIONS_BASE_DIR))
+            with os.scandir(constants.SESSIONS_BASE_DIR) as entries:
+                session_ids = [entry.name for entry in entries
+                               if SessionsHandler._session_id_regex.fullmatch(entry.name) and entry.is_dir()]
         return session_ids
@@ -16,6 +16,7 @@ Handles the configuration file parsing.
 """
 
 import enum
+import functools
 import uuid
 import dataclasses
 import re
@@ -24,6 +25,7 @@ import logging
 import pathlib
 import shutil
 import typing
+import concurrent.futures
 import pydantic
 import git
 import docker
@@ -72,6 +74,14 @@ class ParameterGroupIdentifier(str, enum.Enum):
     RUN = "run"
 
 
+# parameter groups for the parameter group identifiers of the REST API
+PARAMETER_GROUPS = {
+    ParameterGroupIdentifier.COMMON: dataformats.ParameterGroup.COMMON,
+    ParameterGroupIdentifier.BUILD: dataformats.ParameterGroup.BUILD,
+    ParameterGroupIdentifier.RUN: dataformats.ParameterGroup.RUN
+}
+
+
 class ComputeBackend(enum.Enum):
     """Enumeration of supported compute backends."""
     DOCKER = "docker"
@@ -82,6 +92,9 @@ backend_mapping = {
     ComputeBackend.DOCKER: compute_docker.ComputeDocker
 }
 
+# serializes SysCfg objects directly to JSON bytes (e.g. for the syscfg.json file of the compute backend)
+SYSCFG_ADAPTER = pydantic.TypeAdapter(dataformats.SysCfg)
+
 
 class System:
     """Defines all system-instance related parts.
@@ -93,6 +106,9 @@ class System:
     # get sunrise system logger for static methods
     log = logging.getLogger('sunrise.system')
 
+    # regular expression to match a full git commit id
+    _commit_id_regex = re.compile(r'^[0-9a-f]{40}$')
+
     def __init__(self, session_id: str, syscfg: dataformats.SysCfg, repo_clone_path: os.PathLike, remote: bool) -> None:
         """Parses SysCfg and creates a system instance from it."""
         # get sunrise system logger for instance methods
@@ -140,8 +156,8 @@ class System:
             message = "sysdef.json is missing in cloned repository!"
             self._log.error(message)
             raise FileNotFoundError(message)
-        with open(source, 'r', encoding='utf-8') as sysdef_file:
-            system_definition: dataformats.SysDef = dataformats.SysDef.model_validate_json(sysdef_file.read())
+        with open(source, 'rb') as sysdef_file:
+            system_definition: dataformats.SysDef = System.parse_system_definition(sysdef_file.read())
         return system_definition
 
     def __clone_repository(self, url, branch, path):
@@ -150,11 +166,17 @@ class System:
         try:
             system_repo = git.Repo.init(path)
             git_remote = system_repo.create_remote("origin", url)
-            git_remote.fetch(branch, depth=1)
+            # shallow fetch of the requested branch only (also for submodules), tags are not required
+            git_remote.fetch(branch, depth=1, no_tags=True)
             system_repo.git.checkout("FETCH_HEAD")
-            for submodule in system_repo.submodules:
-                self.__clone_repository(submodule.url, submodule.branch_name,
-                                        os.path.join(path, submodule.path))
+            # clone the submodules concurrently as each clone mainly waits for the network
+            submodules = list(system_repo.submodules)
+            if len(submodules) > 0:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(submodules))) as executor:
+                    futures = [executor.submit(self.__clone_repository, submodule.url, submodule.branch_name,
+                                               os.path.join(path, submodule.path)) for submodule in submodules]
+                    for future in concurrent.futures.as_completed(futures):
+                        future.result()
         except git.GitCommandError as exc:
             message = f"Failed to clone the git repository '{url}': {str(exc)}"
             self._log.error(message)
@@ -311,14 +333,8 @@ class System:
         self.data = SystemData(parameters=parameter_groups, results=sysdef.results)
 
         # get all repo files for compute backend
-        repo_files = []
         container_repo_path = os.path.join(constants.CONTAINER_WORKDIR, 'repository')
-        for file in pathlib.Path(repo_clone_path).rglob('*'):
-            repo_files.append(
-                compute_if.ComputeFile(source_path=str(file),
-                                       destination_path=os.path.join(
-                                           container_repo_path,
-                                           str(file.relative_to(repo_clone_path)))))
+        repo_files = System.__get_repository_files(repo_clone_path, container_repo_path)
         # set compute backend to local docker daemon
         compute_data = compute_if.ComputeSystem(
             session_id=self.session_id, image=docker_image, mount_dir=constants.CONTAINER_WORKDIR,
@@ -335,6 +351,20 @@ class System:
 
         self._log.info("#### End of system configuration file parsing ...")
 
+    @staticmethod
+    def __get_repository_files(repo_clone_path: str, container_repo_path: str) -> list[compute_if.ComputeFile]:
+        """Returns all directories and files of the cloned repository with their paths inside the container."""
+        repo_files = []
+        # all walked directory paths start with the clone path -> cut it off to get the relative path
+        repo_path_length = len(str(repo_clone_path).rstrip(os.sep)) + 1
+        for dir_path, dir_names, file_names in os.walk(repo_clone_path):
+            container_dir_path = os.path.join(container_repo_path, dir_path[repo_path_length:])
+            repo_files.extend(
+                compute_if.ComputeFile(source_path=os.path.join(dir_path, name),
+                                       destination_path=os.path.join(container_dir_path, name))
+                for name in dir_names + file_names)
+        return repo_files
+
     def get_current_system_config(self) -> dataformats.SysCfg:
         """Returns the current system configuration of the provided session."""
         syscfg_parameters = {dataformats.ParameterGroup.COMMON: {},
@@ -349,15 +379,20 @@ class System:
                     self._log.debug("Adding file '%s' as parameter, which is already available in the workspace.",
                                     parameter.file_data.file_path_container)
                     syscfg_parameters[group_name][parameter.name] = parameter.file_data.file_path_container
+                elif isinstance(parameter.value, dict):
+                    # URL parameter updated with a plain dictionary -> validate it once here
+                    syscfg_parameters[group_name][parameter.name] = dataformats.SysCfgUrlParameter.model_validate(
+                        parameter.value)
                 else:
                     # simple parameter -> just add to dict
                     syscfg_parameters[group_name][parameter.name] = parameter.value
 
-        return dataformats.SysCfg(system=dataformats.SysCfgSystem(name=self.system_id.name,
-                                                                  version=self.system_id.version),
-                                  common_parameters=syscfg_parameters[dataformats.ParameterGroup.COMMON],
-                                  build_parameters=syscfg_parameters[dataformats.ParameterGroup.BUILD],
-                                  run_parameters=syscfg_parameters[dataformats.ParameterGroup.RUN])
+        # all values are taken from the already validated parameters, so the instance is constructed without validation
+        return dataformats.SysCfg.model_construct(
+            system=dataformats.SysCfgSystem.model_construct(name=self.system_id.name, version=self.system_id.version),
+            common_parameters=syscfg_parameters[dataformats.ParameterGroup.COMMON],
+            build_parameters=syscfg_parameters[dataformats.ParameterGroup.BUILD],
+            run_parameters=syscfg_parameters[dataformats.ParameterGroup.RUN])
 
     def get_parameter(self, parameter_group: dataformats.ParameterGroup | str,
                       parameter_name: str) -> parameters.Parameter | None:
@@ -394,12 +429,26 @@ class System:
             parameter.mark_file_parameter_available()
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def parse_system_definition(sysdef_json: bytes) -> dataformats.SysDef:
+        """Parses and validates the content of a system definition file.
+
+        The result is cached per file content, as the same system definition is parsed for every session of a system.
+        The returned object is shared and must not be modified.
+        """
+        return dataformats.SysDef.model_validate_json(sysdef_json)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_system_definition(system_name: str, system_version: str) -> dataformats.SysDef:
-        """Extracts the system definition file from the git repository of the system."""
+        """Extracts the system definition file from the git repository of the system.
+
+        The result is cached per system name and version, use 'clear_system_cache' to fetch it again.
+        """
         try:
             files_path = System.extract_files_from_system_repo(system_name, system_version, 'sysdef.json')
-            with open(os.path.join(files_path, 'sysdef.json'), 'r', encoding='UTF-8') as sysdef_file:
-                sysdef = dataformats.SysDef.model_validate_json(sysdef_file.read())
+            with open(os.path.join(files_path, 'sysdef.json'), 'rb') as sysdef_file:
+                sysdef = System.parse_system_definition(sysdef_file.read())
         except pydantic.ValidationError as exc:
             error_listing = "SysDef Validation Errors:\n"
             for err_inst in exc.errors():
@@ -415,12 +464,17 @@ class System:
                 pass
         return sysdef
 
+    @staticmethod
+    @functools.cache
+    def __get_docker_client() -> docker.DockerClient:
+        """Returns the Docker client for image operations, which is created once and shared by all requests."""
+        return docker.from_env()
+
     @staticmethod
     def __extract_sysdef_from_image(image_url, label_name, work_dir: pathlib.Path):
         """Extracts the sysdef from the label meta-data of the system docker image."""
         try:
-            # initialize docker client
-            client = docker.from_env()
+            client = System.__get_docker_client()
 
             # If image is from remote: pull it
             if "/" in image_url:
@@ -499,10 +553,9 @@ class System:
             url = sysref.location
             branch = sysref.branch
             # set the git clone options to check out only the requested files
-            git_clone_options = ["--depth 1", "--filter=blob:none", "--no-checkout"]
+            git_clone_options = ["--depth 1", "--filter=blob:none", "--no-checkout", "--no-tags"]
             # check if branch is a commit id -> no branch flag required
-            commit_id_pattern = re.compile(r'^[0-9a-f]{40}$')
-            if not bool(commit_id_pattern.match(branch)):
+            if not System._commit_id_regex.match(branch):
                 git_clone_options.append(f"-b {branch}")
             repo = git.Repo.clone_from(url=url, to_path=tmp_repo, multi_options=git_clone_options)
             # iterate over requested files and enable sparse checkout for these files
@@ -520,13 +573,20 @@ class System:
 
         return tmp_repo
 
+    @staticmethod
+    def clear_system_cache():
+        """Clears the cached system definitions and descriptions, e.g. after a system repository was updated."""
+        System.get_system_definition.cache_clear()
+        System.__get_system_markdown_description.cache_clear()
+        System.parse_system_definition.cache_clear()
+
     @staticmethod
     def get_system_description(system_name: str, system_version: str) -> str:
-        """Returns the system description as markdown-formatted string."""
-        files_path = System.extract_files_from_system_repo(system_name, system_version, 'sysdef.json')
-        with open(os.path.join(files_path, 'sysdef.json'), 'r', encoding='UTF-8') as sysdef_file:
-            sysdef = dataformats.SysDef.model_validate_json(sysdef_file.read())
-        shutil.rmtree(files_path)
+        """Returns the system description as markdown-formatted string.
+
+        The markdown file is cached per system name and version, use 'clear_system_cache' to fetch it again.
+        """
+        sysdef = System.get_system_definition(system_name, system_version)
 
         # return information if no documentation is available for the system
         if sysdef.documentation is None:
@@ -536,17 +596,24 @@ class System:
             return sysdef.documentation.summary
 
         try:
-            files_path = System.extract_files_from_system_repo(system_name, system_version,
-                                                               sysdef.documentation.description)
+            return System.__get_system_markdown_description(system_name, system_version,
+                                                            sysdef.documentation.description)
         except RuntimeError:
-            # markdown file is not present -> just return the field content
+            # markdown file cannot be fetched -> just return the field content (not cached, so the markdown file is
+            # fetched again on the next request)
             return sysdef.documentation.description
 
-        markdown_path = os.path.join(files_path, sysdef.documentation.description)
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def __get_system_markdown_description(system_name: str, system_version: str, description_path: str) -> str:
+        """Returns the markdown file of the system description with embedded images."""
+        files_path = System.extract_files_from_system_repo(system_name, system_version, description_path)
+
+        markdown_path = os.path.join(files_path, description_path)
         if os.path.isfile(markdown_path):
             with open(markdown_path, "r", encoding="UTF-8") as input_file:
                 markdown_content = input_file.read()
-            markdown_dir = os.path.dirname(sysdef.documentation.description)
+            markdown_dir = os.path.dirname(description_path)
             markdown_embedder = documentation.MarkdownImageEmbedder(markdown_content, markdown_dir)
             # add relative path of markdown file to all images paths to get valid images paths in perspective
             # of git repository root
@@ -554,7 +621,7 @@ class System:
             for image_path in markdown_embedder.extract_images_paths_from_markdown():
                 image_paths.append(os.path.join(markdown_dir, image_path))
         else:
-            return sysdef.documentation.description
+            return description_path
         shutil.rmtree(files_path)
 
         files_path = System.extract_files_from_system_repo(system_name, system_version, image_paths)
@@ -574,16 +641,17 @@ class System:
         destination_file = os.path.join(destination_path, 'syscfg.json')
         if not os.path.isdir(destination_path):
             os.mkdir(destination_path)
-        with open(destination_file, 'w', encoding='utf-8') as syscfg_file:
-            syscfg_file.write(syscfg.model_dump_json())
+        # write the serialized bytes with a single call without an intermediate string
+        with open(destination_file, 'wb') as syscfg_file:
+            syscfg_file.write(SYSCFG_ADAPTER.dump_json(syscfg))
         return destination_file
 
     def __get_file_copy_list(self, parameter_group: dataformats.ParameterGroup) -> list[compute_if.ComputeFile]:
         """Returns the list of file copy objects for staged files of a specific parameter group."""
         files: list[compute_if.ComputeFile] = []
+        parameters.stage_files_parallel(self.data.parameters[parameter_group], self.session_id, parameter_group)
         for parameter in self.data.parameters[parameter_group]:
-            parameter.stage_file(self.session_id, parameter_group)
-            if parameter.file_data is not None and parameter.file_data.file_state == parameters.FileState.STAGED:
+            if parameter.file_data is not None and parameter.file_data.file_state is parameters.FileState.STAGED:
                 files.append(compute_if.ComputeFile(source_path=parameter.file_data.file_path_local,
                                                     destination_path=parameter.file_data.file_path_container))
         return files
@@ -105,21 +105,36 @@ class SystemJsonFile(SystemDatabaseInterface):
     def __init__(self) -> None:
         """Opens and parses the JSON file containing the system references."""
         self.json_file = constants.SYSTEM_REFERENCES_FILE
+        # parsed file content and modification time of the parsed file
+        self._systems: Systems = None
+        self._systems_mtime: int = None
 
     def __parse_file(self) -> Systems:
-        """Parses the system reference file and writes the content to member variable."""
-        if os.path.isfile(self.json_file):
-            with open(self.json_file, 'r', encoding='utf-8') as file:
-                return Systems.model_validate_json(file.read())
-        else:
+        """Parses the system reference file, the content is parsed again only if the file was modified."""
+        try:
+            mtime = os.stat(self.json_file).st_mtime_ns
+        except FileNotFoundError:
             return Systems(systems=[])
+        if mtime != self._systems_mtime:
+            with open(self.json_file, 'rb') as file:
+                self._systems = Systems.model_validate_json(file.read())
+            self._systems_mtime = mtime
+        return self._systems
+
+    def __write_file(self, systems_db: Systems):
+        """Writes the system references to the JSON file."""
+        try:
+            with open(self.json_file, 'w', encoding='utf-8') as file:
+                file.write(systems_db.model_dump_json(indent=2))
+        finally:
+            # the parsed content might have been modified -> parse file again on next access
+            self._systems_mtime = None
 
     def create_system(self, system: System) -> System:
         """Create a new system entry in the JSON file."""
         systems_db = self.__parse_file()
         systems_db.systems.append(system)
-        with open(self.json_file, 'w', encoding='utf-8') as file:
-            file.write(systems_db.model_dump_json(indent=2))
+        self.__write_file(systems_db)
         return system
 
     def get_system_names(self) -> list[str]:
@@ -166,8 +181,7 @@ class SystemJsonFile(SystemDatabaseInterface):
                     system_entry.location = system.location
                 if system.branch is not None:
                     system_entry.branch = system.branch
-                with open(self.json_file, 'w', encoding='utf-8') as file:
-                    file.write(systems_db.model_dump_json(indent=2))
+                self.__write_file(systems_db)
                 return system_entry
         raise SystemNotFound(f"Cannot find the system '{name}' with version '{version}'!")
 
@@ -177,8 +191,7 @@ class SystemJsonFile(SystemDatabaseInterface):
         for system_entry in systems_db.systems:
             if system_entry.name == name and system_entry.version == version:
                 systems_db.systems.remove(system_entry)
-                with open(self.json_file, 'w', encoding='utf-8') as file:
-                    file.write(systems_db.model_dump_json(indent=2))
+                self.__write_file(systems_db)
                 return True
         raise SystemNotFound(f"Cannot find the system '{name}' with version '{version}'!")
 
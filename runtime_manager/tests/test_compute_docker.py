@@ -0,0 +1,77 @@
+# Copyright (c) 2025 Robert Bosch GmbH
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests the Docker-based compute backend without a Docker daemon.
+"""
+
+import pathlib
+import pickle
+import sys
+import unittest
+from unittest import mock
+
+# the modules of SUNRISE Runtime Manager are imported as top-level modules
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+
+# pylint: disable-next=wrong-import-position
+import compute_if  # noqa: E402
+# pylint: disable-next=wrong-import-position
+import compute_docker  # noqa: E402
+
+
+class TestComputeDocker(unittest.TestCase):
+    """Tests the container handling of the Docker-based compute backend."""
+
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.containers.run.return_value.wait.return_value = {'StatusCode': 0}
+        self.client.containers.run.return_value.logs.return_value = b'output'
+        patcher = mock.patch.object(compute_docker.docker, 'from_env', return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(compute_docker._pulled_images.clear)  # pylint: disable=protected-access
+
+    def create_backend(self) -> compute_docker.ComputeDocker:
+        """Creates the compute backend of a session with an image of a container registry."""
+        backend = compute_docker.ComputeDocker()
+        backend.create_resource(compute_if.ComputeSystem(
+            session_id='session', image='registry.example.com/system:1.0', local_dir='/sessions',
+            mount_dir='/sysapi', work_dir='/sysapi/repository', build_command='build', run_command='run',
+            delete_command=None, files=[], requirements={}))
+        return backend
+
+    def test_pull_image_once_per_session(self):
+        """Builds of restored copies of the compute backend pull the image only once."""
+        # asynchronous builds restore their own copy of the compute backend from the session file
+        session_file_data = pickle.dumps(self.create_backend())
+        pickle.loads(session_file_data).build_system(files=[])
+        pickle.loads(session_file_data).build_system(files=[])
+
+        self.client.images.pull.assert_called_once_with('registry.example.com/system:1.0')
+        self.assertEqual(self.client.containers.run.call_count, 2)
+
+    def test_pull_image_after_removal(self):
+        """The image is pulled again for a session after its resources were removed."""
+        backend = self.create_backend()
+        backend.build_system(files=[])
+        self.client.containers.list.return_value = []
+        backend.remove_resource()
+        self.create_backend().build_system(files=[])
+
+        self.assertEqual(self.client.images.pull.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+# Copyright (c) 2025 Robert Bosch GmbH
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests the restricted unpickler used to load session files.
+"""
+
+import copyreg
+import datetime
+import io
+import logging
+import pathlib
+import pickle
+import sys
+import unittest
+import uuid
+
+# the modules of SUNRISE Runtime Manager are imported as top-level modules, the dataformats package is located in
+# the source directory (Docker image) or in the repository root directory
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+sys.path.append(str(SRC_DIR.parent.parent))
+
+# pylint: disable-next=wrong-import-position
+import session  # noqa: E402
+# pylint: disable-next=wrong-import-position
+import system  # noqa: E402
+# pylint: disable-next=wrong-import-position
+import parameters  # noqa: E402
+# pylint: disable-next=wrong-import-position
+import compute_if  # noqa: E402
+# pylint: disable-next=wrong-import-position
+from dataformats import dataformats  # noqa: E402
+
+
+def load(data: bytes):
+    """Loads pickled data with the session unpickler."""
+    return session.SessionUnpickler(io.BytesIO(data)).load()
+
+
+class BaselineObject:
+    """Stand-in for an object in the format of session files of version 1.0.
+
+    The object is pickled as the class and its instance dictionary, independent of the current definition of the
+    class (e.g. slots or a changed __getstate__()).
+    """
+
+    def __init__(self, cls, **state) -> None:
+        self.cls = cls
+        self.state = state
+
+    @property
+    def __class__(self):
+        # pickle checks that the class of a reconstructed object matches the class of the pickled object
+        return self.cls
+
+
+class BaselinePickler(pickle.Pickler):
+    """Pickles BaselineObject stand-ins like objects of version 1.0."""
+
+    def reducer_override(self, obj):
+        if type(obj) is BaselineObject:  # pylint: disable=unidiomatic-typecheck
+            return copyreg.__newobj__, (obj.cls,), obj.state
+        return NotImplemented
+
+
+def dump_baseline(obj) -> bytes:
+    """Pickles an object graph with BaselineObject stand-ins with the default protocol of version 1.0."""
+    file = io.BytesIO()
+    BaselinePickler(file, protocol=4).dump(obj)
+    return file.getvalue()
+
+
+class TestSessionUnpickler(unittest.TestCase):
+    """Tests that session files can only restore the classes of a session."""
+
+    def test_dotted_name_of_allowed_module(self):
+        """A dotted name must not resolve a global of a module imported by an allowed module."""
+        # protocol 4: session.os.getcwd() via STACK_GLOBAL and REDUCE
+        malicious_data = b'\x80\x04\x8c\x07session\x8c\x09os.getcwd\x93)R.'
+        with self.assertRaises(pickle.UnpicklingError):
+            load(malicious_data)
+
+    def test_global_of_forbidden_module(self):
+        """Globals of modules which are not part of a session must not be restored."""
+        # protocol 0: os.system('true') via GLOBAL and REDUCE
+        malicious_data = b"cos\nsystem\n(S'true'\ntR."
+        with self.assertRaises(pickle.UnpicklingError):
+            load(malicious_data)
+
+    def test_unlisted_global_of_allowed_module(self):
+        """Only the listed globals of an allowed module can be restored."""
+        malicious_data = b'\x80\x04\x8c\x07session\x8c\x08LruCache\x93.'
+        with self.assertRaises(pickle.UnpicklingError):
+            load(malicious_data)
+
+    def test_session_data(self):
+        """Data types which are stored in session files can be restored."""
+        session_data = {
+            'session_id': uuid.uuid4(),
+            'state': dataformats.State.BUILT,
+            'log_entries': [dataformats.LogEntry(timestamp=datetime.datetime.now(), producer="test",
+                                                 message="message")],
+            'files': {'file'}
+        }
+        self.assertEqual(load(pickle.dumps(session_data, protocol=pickle.HIGHEST_PROTOCOL)), session_data)
+
+    def test_session_file_of_version_1_0(self):
+        """Session files of version 1.0 can be restored."""
+        session_id = uuid.uuid4()
+        file_data = BaselineObject(parameters.FileData, file_name='input.txt',
+                                   file_state=parameters.FileState.AVAILABLE, file_path_default='default.txt',
+                                   file_path_origin='input.txt', file_path_local='/sessions/input.txt',
+                                   file_path_container='/sysapi/inputs/input.txt', credentials=None)
+        # parameters of version 1.0 store their logger as instance attribute
+        parameter = BaselineObject(parameters.Parameter, _log=logging.getLogger('sunrise.system'), name='input',
+                                   value='input.txt', overwritten=True, meta_data=dataformats.SysDefParameterFile(),
+                                   file_data=file_data, default_value='default.txt')
+        system_data = BaselineObject(system.System, session_id=str(session_id),
+                                     data=BaselineObject(system.SystemData,
+                                                         parameters={dataformats.ParameterGroup.RUN: [parameter]},
+                                                         results={}),
+                                     system_id=BaselineObject(system.SystemIdentifier, name='test', version='1.0'),
+                                     has_build=False, syscfg_container_path='/sysapi/inputs/syscfg.json',
+                                     compute_backend=None)
+        # the creation date of version 1.0 is a string
+        details = BaselineObject(session.SessionDetails, display_name='test', session_description='',
+                                 creator_name='', creation_date=str(datetime.datetime.now()), remote=False)
+        session_data = BaselineObject(session.Session, system=system_data, details=details,
+                                      state=dataformats.State.BUILT, session_id=session_id, log_entries=[])
+        # sessions of version 1.0 contain the handler which saved the session
+        session_data.state['session_handler'] = BaselineObject(session.SessionsHandler,
+                                                               _log=logging.getLogger('sunrise.session'),
+                                                               session_id=session_id, read_only=False, force=False,
+                                                               session=session_data)
+        compute_system = BaselineObject(compute_if.ComputeSystem, session_id=str(session_id), image='image',
+                                        local_dir='/sessions', mount_dir='/sysapi', work_dir='/sysapi/repository',
+                                        build_command=None, run_command='run', delete_command=None,
+                                        files=[BaselineObject(compute_if.ComputeFile, source_path='/sessions/file',
+                                                              destination_path='/sysapi/repository/file')],
+                                        requirements={})
+
+        loaded_session, loaded_compute_system = load(dump_baseline([session_data, compute_system]))
+
+        self.assertIsInstance(loaded_session, session.Session)
+        self.assertFalse(hasattr(loaded_session, 'session_handler'))
+        self.assertEqual(loaded_session.details.creation_date, details.state['creation_date'])
+        loaded_parameter = loaded_session.system.get_parameter(dataformats.ParameterGroup.RUN, 'input')
+        self.assertEqual(loaded_parameter.file_data.file_state, parameters.FileState.AVAILABLE)
+        loaded_parameter.update_parameter('other.txt')
+        self.assertEqual(loaded_parameter.value, 'other.txt')
+        self.assertEqual(loaded_compute_system.files[0].destination_path, '/sysapi/repository/file')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# Copyright (c) 2025 Robert Bosch GmbH
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests the loading and saving of session files.
+"""
+
+import logging
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+import unittest
+import uuid
+from unittest import mock
+
+# the modules of SUNRISE Runtime Manager are imported as top-level modules, the dataformats package is located in
+# the source directory (Docker image) or in the repository root directory
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+sys.path.append(str(SRC_DIR.parent.parent))
+
+# pylint: disable-next=wrong-import-position
+import constants  # noqa: E402
+# pylint: disable-next=wrong-import-position
+import session  # noqa: E402
+# pylint: disable-next=wrong-import-position
+from dataformats import dataformats  # noqa: E402
+
+
+class TestSessionsHandler(unittest.TestCase):
+    """Tests that opened sessions always contain the data of the last save."""
+
+    def setUp(self):
+        sessions_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(sessions_dir.cleanup)
+        patcher = mock.patch.object(constants, 'SESSIONS_BASE_DIR', sessions_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # session without a system, which is sufficient to change and save its state
+        self.session_id = uuid.uuid4()
+        session_data = session.Session.__new__(session.Session)
+        session_data.__dict__.update(_log=logging.getLogger('sunrise.session'), system=None, details=None,
+                                     state=dataformats.State.CREATED, session_id=self.session_id, log_entries=[],
+                                     _parameter_data=session.ParameterData())
+        file_paths = session.SessionFilePaths.from_session_id(self.session_id)
+        os.makedirs(os.path.dirname(file_paths.session_file))
+        with open(file_paths.session_file, 'wb') as file:
+            pickle.dump(session_data, file)
+        with open(file_paths.version_marker_file, mode='w', encoding='utf-8') as file:
+            file.write(constants.SUNRISE_RUNTIME_MANAGER_VERSION)
+        self.addCleanup(self.forget_session)
+
+    def forget_session(self):
+        """Removes the session from the caches of the sessions handler."""
+        # pylint: disable=protected-access
+        session.SessionsHandler._opened_sessions.pop(str(self.session_id), None)
+        session.SessionsHandler._loaded_sessions.pop(str(self.session_id))
+        session.SessionsHandler._save_generations.pop(str(self.session_id), None)
+
+    def test_open_session_saved_while_loading(self):
+        """A session saved while it is loaded by a reader is loaded again even if the file status is unchanged."""
+        session_file = session.SessionFilePaths.from_session_id(self.session_id).session_file
+        # the replaced session file can get the same file status, e.g. a reused inode and a coarse modification time
+        file_stat = os.stat(session_file)
+        stat = os.stat
+
+        def stat_with_unchanged_session_file(path, *args, **kwargs):
+            return file_stat if path == session_file else stat(path, *args, **kwargs)
+
+        read_storage_file = session.SessionsHandler._SessionsHandler__read_storage_file  # pylint: disable=no-member
+        saved = []
+
+        def read_storage_file_and_save(handler):
+            session_file_data = read_storage_file(handler)
+            # save the session after the reader has read the old session data
+            if not saved:
+                saved.append(True)
+                with session.SessionsHandler(self.session_id) as session_data:
+                    session_data.state = dataformats.State.BUILT
+            return session_file_data
+
+        with mock.patch.object(session.os, 'stat', stat_with_unchanged_session_file), \
+                mock.patch.object(session.SessionsHandler, '_SessionsHandler__read_storage_file',
+                                  read_storage_file_and_save):
+            with session.SessionsHandler(self.session_id, read_only=True) as session_data:
+                self.assertEqual(session_data.state, dataformats.State.CREATED)
+            with session.SessionsHandler(self.session_id, read_only=True) as session_data:
+                self.assertEqual(session_data.state, dataformats.State.BUILT)
+
+
+if __name__ == '__main__':
+    unittest.main()
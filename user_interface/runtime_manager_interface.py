@@ -20,8 +20,10 @@ import inspect
 import json
 import logging
 import os
+import threading
 import time
 import typing
+import pydantic
 import requests
 import streamlit as st
 
@@ -34,14 +36,27 @@ class SunriseClientError(Exception):
     """Custom exception from the SUNRISE Runtime Manager access."""
 
 
+# HTTP sessions to reuse the connections to the Runtime Manager (e.g. for status polling), one per thread as
+# requests.Session is not thread-safe and Streamlit runs each user session in its own thread
+_http_sessions = threading.local()
+
+
+def __get_http_session() -> requests.Session:
+    """INTERNAL function to get the HTTP session of the current thread."""
+    http_session = getattr(_http_sessions, 'session', None)
+    if http_session is None:
+        http_session = requests.Session()
+        _http_sessions.session = http_session
+    return http_session
+
+
 def __send_request(request: requests.Request, timeout_s: int = 10) -> requests.Response:
     """INTERNAL function to send the request over the REST API and handle potential errors of the response."""
     try:
         prepared_request = request.prepare()
-        with requests.Session() as session:
-            response = session.send(prepared_request, timeout=timeout_s)
-            response.raise_for_status()
-            return response
+        response = __get_http_session().send(prepared_request, timeout=timeout_s)
+        response.raise_for_status()
+        return response
     except requests.exceptions.HTTPError as exc:
         if response.text == "Internal Server Error":
             details = "Internal Runtime Manager Error"
@@ -67,6 +82,10 @@ class ResultObject:
     session_id: str
 
 
+# validator for the result list of a session, created once as it is used on every result list request
+RESULT_INFO_LIST_ADAPTER = pydantic.TypeAdapter(list[sdf.ResultInfo])
+
+
 # RUNTIME MANAGER ACCESS ###############################################################################################
 def get_version(rm_address: str) -> typing.Tuple[bool, str]:
     """Get the version of the connected Runtime Manager."""
@@ -75,11 +94,11 @@ def get_version(rm_address: str) -> typing.Tuple[bool, str]:
         response = __send_request(requests.Request('GET', f"{rm_address}/version"), timeout_s=3)
         response = response.text
         connection_good = True
-        logging.debug(f"Retrieved RM version: {response}")
+        logging.debug("Retrieved RM version: %s", response)
     except SunriseClientError as exc:
         response = str(exc)
         connection_good = False
-        logging.error(f"[rm_get_version()] Error: {exc}")
+        logging.error("[rm_get_version()] Error: %s", exc)
     return connection_good, response
 
 
@@ -96,7 +115,7 @@ def get_systems(rm_address: str) -> dict:
             for version in versions:
                 system_names.append(system_name + ":" + version)
     except SunriseClientError as exc:
-        logging.error(f"[rm_get_systems()] Error: {exc}")
+        logging.error("[rm_get_systems()] Error: %s", exc)
     return system_names
 
 
@@ -107,9 +126,9 @@ def get_system_info(rm_address: str, system: str) -> typing.Union[sdf.SysDef, No
         system = system.split(':', 1)
         response = __send_request(requests.Request('GET', f"{rm_address}/system/{system[0]}/{system[1]}"),
                                   timeout_s=100)
-        received_sysdef = sdf.SysDef.model_validate(json.loads(response.text))
+        received_sysdef = sdf.SysDef.model_validate_json(response.content)
     except SunriseClientError as exc:
-        logging.error(f"[rm_get_system_info()] Error: {exc}")
+        logging.error("[rm_get_system_info()] Error: %s", exc)
         received_sysdef = None
     return received_sysdef
 
@@ -120,6 +139,15 @@ def session_status(rm_address: str, session_id: str) -> sdf.State:
     return sdf.State(json.loads(response.text))
 
 
+def session_wait_status(rm_address: str, session_id: str, state: sdf.State, timeout_sec: float) -> sdf.State:
+    """Wait until the status of an existing session differs from the passed state, at most for the timeout."""
+    timeout_sec = min(max(timeout_sec, 0.0), 30.0)
+    response = __send_request(requests.Request('GET', f"{rm_address}/session/{session_id}/status/wait",
+                                                params={'state': state.value, 'timeout': timeout_sec}),
+                              timeout_s=timeout_sec + 5)
+    return sdf.State(json.loads(response.text))
+
+
 def session_set_fileparam(rm_address: str, session_id: str, param: uiu.ParamHandler, file: bytes,
                           filename: str = None) -> bool:
     """Change the data of a file-parameter in an existing session on the Runtime Manager."""
@@ -147,7 +175,7 @@ def session_set_fileparam(rm_address: str, session_id: str, param: uiu.ParamHand
         __send_request(request, timeout_s=30)
         success = True
     except SunriseClientError as exc:
-        logging.error(f"[rm_session_set_fileparam()] failed: {exc}")
+        logging.error("[rm_session_set_fileparam()] failed: %s", exc)
         success = False
     return success
 
@@ -169,13 +197,13 @@ def session_create(rm_address: str, sescfg: uiu.SesCfg) -> typing.Tuple[str, uiu
 
         session_id = json.loads(response.text)
         status.succeed("Session-ID: " + session_id)
-        logging.info(f"... ID is {session_id}")
+        logging.info("... ID is %s", session_id)
     except TypeError as type_err:
         logging.error("TypeError: Could not create session. Probably syscfg is invalid.")
         status.fail(str(type_err))
         session_id = None
     except SunriseClientError as exc:
-        logging.error(f"[rm_session_create()] failed: {exc}")
+        logging.error("[rm_session_create()] failed: %s", exc)
         status.fail(str(exc))
         session_id = None
     return session_id, status
@@ -184,20 +212,19 @@ def session_create(rm_address: str, sescfg: uiu.SesCfg) -> typing.Tuple[str, uiu
 def session_build(rm_address: str, session_id: str, timeout_sec: int = 300) -> uiu.ActionStatus:
     """Execute the build step for an existing session."""
     logging.info("Calling BUILD")
-    logging.debug(f"Session '{session_id}', Timeout {timeout_sec} sec.")
+    logging.debug("Session '%s', Timeout %s sec.", session_id, timeout_sec)
     status = uiu.ActionStatus()
     try:
         request = requests.Request('POST', f"{rm_address}/session/{session_id}/build", params={'timeout': timeout_sec})
         __send_request(request, timeout_s=5)
 
-        timeout_counter = 0
+        deadline = time.monotonic() + timeout_sec
         ses_stat = session_status(rm_address, session_id)
-        while (ses_stat is sdf.State.BUILDING) and (timeout_counter < timeout_sec):
-            time.sleep(1)
-            timeout_counter += 1
-            ses_stat = session_status(rm_address, session_id)
+        # wait for state changes on the Runtime Manager instead of polling the status
+        while (ses_stat is sdf.State.BUILDING) and (time.monotonic() < deadline):
+            ses_stat = session_wait_status(rm_address, session_id, ses_stat, deadline - time.monotonic())
 
-        if timeout_counter >= timeout_sec:
+        if ses_stat is sdf.State.BUILDING:
             status.fail("Timeout")
             logging.error("Timeout!")
             __send_request(requests.Request('POST', f"{rm_address}/session/{session_id}/stop"), timeout_s=5)
@@ -210,26 +237,25 @@ def session_build(rm_address: str, session_id: str, timeout_sec: int = 300) -> u
                 status.succeed(log)
     except SunriseClientError as exc:
         status.fail(str(exc))
-        logging.error(f"[rm_session_build()] Exception: {status.get_message()}")
+        logging.error("[rm_session_build()] Exception: %s", status.get_message())
     return status
 
 
 def session_run(rm_address: str, session_id: str, timeout_sec: int = 300) -> uiu.ActionStatus:
     """Execute the run step for an existing session."""
     logging.info("Calling RUN")
-    logging.debug(f"Session '{session_id}', Timeout {timeout_sec} sec.")
+    logging.debug("Session '%s', Timeout %s sec.", session_id, timeout_sec)
     status = uiu.ActionStatus()
     try:
         request = requests.Request('POST', f"{rm_address}/session/{session_id}/run", params={'timeout': timeout_sec})
         __send_request(request, timeout_s=5)
-        timeout_counter = 0
+        deadline = time.monotonic() + timeout_sec
         ses_stat = session_status(rm_address, session_id)
-        while (ses_stat is sdf.State.RUNNING) and (timeout_counter < timeout_sec):
-            time.sleep(1)
-            timeout_counter += 1
-            ses_stat = session_status(rm_address, session_id)
+        # wait for state changes on the Runtime Manager instead of polling the status
+        while (ses_stat is sdf.State.RUNNING) and (time.monotonic() < deadline):
+            ses_stat = session_wait_status(rm_address, session_id, ses_stat, deadline - time.monotonic())
 
-        if timeout_counter >= timeout_sec:
+        if ses_stat is sdf.State.RUNNING:
             status.fail("Timeout")
             logging.error("Timeout!")
             __send_request(requests.Request('POST', f"{rm_address}/session/{session_id}/stop"), timeout_s=5)
@@ -242,7 +268,7 @@ def session_run(rm_address: str, session_id: str, timeout_sec: int = 300) -> uiu
                 status.succeed(log)
     except SunriseClientError as exc:
         status.fail(str(exc))
-        logging.error(f"[rm_session_run()] Exception: {status.get_message()}")
+        logging.error("[rm_session_run()] Exception: %s", status.get_message())
     return status
 
 
@@ -256,7 +282,7 @@ def session_remove(rm_address: str, session_id: str) -> uiu.ActionStatus:
             status.succeed("Removed " + session_id)
     except SunriseClientError as exc:
         status.fail(str(exc))
-        logging.error(f"[rm_session_remove()] Exception: {status.get_message()}")
+        logging.error("[rm_session_remove()] Exception: %s", status.get_message())
     return status
 
 
@@ -265,11 +291,11 @@ def session_get_log(rm_address: str, session_id: str, producer_name: str) -> str
     action_log = None
     try:
         response = __send_request(requests.Request('GET', f"{rm_address}/session/{session_id}"), timeout_s=5)
-        ses_info = sdf.SessionInfo.model_validate(json.loads(response.text))
-    except json.JSONDecodeError as exc:
-        logging.error(f"Invalid SessionInfo received: {exc}")
+        ses_info = sdf.SessionInfo.model_validate_json(response.content)
+    except pydantic.ValidationError as exc:
+        logging.error("Invalid SessionInfo received: %s", exc)
     except SunriseClientError as exc:
-        logging.error(f"Getting log failed: {exc}")
+        logging.error("Getting log failed: %s", exc)
 
     for log_obj in ses_info.session_logs:
         if log_obj.producer == producer_name:
@@ -281,11 +307,7 @@ def session_get_log(rm_address: str, session_id: str, producer_name: str) -> str
 def session_result_list(rm_address: str, session_id: str) -> list[sdf.ResultInfo]:
     """Get information of all available result objects in the session."""
     response = __send_request(requests.Request('GET', f"{rm_address}/session/{session_id}/result/"), timeout_s=100)
-    results_raw = response.json()
-    results = []
-    for result in results_raw:
-        results.append(sdf.ResultInfo.model_validate(result))
-    return results
+    return RESULT_INFO_LIST_ADAPTER.validate_json(response.content)
 
 
 def fetch_results(rm_address: str, session_id: str, result_name: str) -> ResultObject:
@@ -294,7 +316,7 @@ def fetch_results(rm_address: str, session_id: str, result_name: str) -> ResultO
 
     Returns a tuple of the object as bytes, the filename and the data type.
     """
-    logging.info(f"Downloading result object '{result_name}'...")
+    logging.info("Downloading result object '%s'...", result_name)
     with st.spinner(f"Downloading object '{result_name}' for session '{session_id}'..."):
         response = __send_request(requests.Request('GET', f"{rm_address}/session/{session_id}/result/{result_name}"),
                                   timeout_s=100)
@@ -85,14 +85,14 @@ rm_address = os.getenv("RUNTIME_MANAGER_URL", "http://localhost") + ":" + os.get
 st.caption(f"Runtime Manager address: *{rm_address}*")
 connected, version_message = rmi.get_version(rm_address)
 if not connected:
-    logging.error(f"Could not connect Runtime Manager '{rm_address}'")
+    logging.error("Could not connect Runtime Manager '%s'", rm_address)
     st.error("Runtime Manager not connected (unreachable)")
 
 # Main Part
 if connected:
     st.caption(f"Runtime Manager version: v{version_message}")
     if not st.session_state.mnl_active_system.is_available():
-        logging.debug(f"Getting system details from RM ({rm_address})")
+        logging.debug("Getting system details from RM (%s)", rm_address)
         available_systems = rmi.get_systems(rm_address)
         if st.session_state.mnl_config.system_version is None:
             system = next((sys for sys in available_systems if st.session_state.mnl_config.system_name in sys),
@@ -146,14 +146,14 @@ if connected:
                 for param_key in st.session_state.mnl_config.get_param_keys_to_modify(param_group):
                     param_obj = st.session_state.mnl_active_system[param_group][param_key]
                     if st.session_state[param_obj.ui_widget_key] != param_obj.val_user:
-                        logging.debug(f"Parameter '{param_obj.key}' was modified")
+                        logging.debug("Parameter '%s' was modified", param_obj.key)
                         param_obj.val_user = st.session_state[param_obj.ui_widget_key]
             logging.debug("Starting Session creation")
             st.session_state.mnl_session_id, res = rmi.session_create(
                 rm_address, st.session_state.mnl_active_system.to_sescfg())
             if res.is_good():
                 st.write(f":heavy_check_mark: Created Experiment *'{st.session_state.mnl_session_id}'*")
-                logging.debug(f"Session ID is: {st.session_state.mnl_session_id}")
+                logging.debug("Session ID is: %s", st.session_state.mnl_session_id)
             else:
                 stat.update(label="Create Failed", state="error")
                 logging.error("Session create failed")
@@ -166,7 +166,7 @@ if connected:
                             param_obj = st.session_state.mnl_active_system[param_group][param_key]
                             uploader_value = st.session_state[param_obj.ui_widget_key]
                             if isinstance(uploader_value, st.runtime.uploaded_file_manager.UploadedFile):
-                                logging.debug(f"Uploading file parameter {param_key}")
+                                logging.debug("Uploading file parameter %s", param_key)
                                 success = rmi.session_set_fileparam(rm_address, st.session_state.mnl_session_id,
                                                                     param_obj, uploader_value.getvalue(),
                                                                     uploader_value.name)
@@ -182,7 +182,7 @@ if connected:
                 logging.debug("Build finished successfully")
                 st.write(":heavy_check_mark: Build completed")
             else:
-                logging.error(f"Build failed: {res.get_message()}")
+                logging.error("Build failed: %s", res.get_message())
                 st.error(f"Build failed: {res.get_message()}")
                 stat.update(label="Build Failed", state="error")
             stat.update(label="Running... :repeat:", state="running")
@@ -193,7 +193,7 @@ if connected:
                 st.write(":heavy_check_mark: Run completed")
                 stat.update(label="Finished", state="complete")
             else:
-                logging.error(f"Run failed: {res.get_message()}")
+                logging.error("Run failed: %s", res.get_message())
                 st.error(f"Run failed: {res.get_message()}")
                 stat.update(label="Run Failed", state="error")
             st.rerun()
@@ -219,7 +219,7 @@ if connected:
                     else:
                         st.error(f"Result object '{res_name}' is not known to this system")
             for rtd in results_to_display:
-                logging.debug(f"Displaying result '{rtd.name}'")
+                logging.debug("Displaying result '%s'", rtd.name)
                 result = rmi.fetch_results(rm_address, st.session_state.mnl_session_id, rtd.name)
                 if result.type == dataformats.resultformats.ResultTypes.GENERIC_TEXT:
                     uiu.display_result_gentext(result.data)
@@ -248,5 +248,5 @@ if connected:
                 st.session_state.mnl_params_locked = False
                 st.rerun()
             else:
-                logging.error(f"Could not remove experiment: {res.get_message()}")
+                logging.error("Could not remove experiment: %s", res.get_message())
                 st.error(f"Could not remove experiment '{st.session_state.mnl_session_id}': {res.get_message()}")